@@ -0,0 +1,55 @@
+"""add partial indexes for active bookings
+
+Revision ID: 0c08d1f665c5
+Revises: a64c3df6678f
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0c08d1f665c5"
+down_revision: Union[str, Sequence[str], None] = "a64c3df6678f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_booking_active_table_end",
+            "booking",
+            ["table_id", "end_time", "start_time"],
+            unique=False,
+            postgresql_where=sa.text("status = 'active'"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_booking_active_end",
+            "booking",
+            ["end_time", "start_time"],
+            unique=False,
+            postgresql_where=sa.text("status = 'active'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_booking_active_end",
+            table_name="booking",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_booking_active_table_end",
+            table_name="booking",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,61 @@
+"""notify booking changes
+
+Revision ID: 9f4c6a1568e6
+Revises: 0f80033e6a69
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9f4c6a1568e6"
+down_revision: Union[str, Sequence[str], None] = "0f80033e6a69"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_booking_change() RETURNS trigger AS $$
+        DECLARE
+            changed booking%ROWTYPE;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                changed := OLD;
+            ELSE
+                changed := NEW;
+            END IF;
+            PERFORM pg_notify(
+                'booking_changes',
+                json_build_object(
+                    'op', TG_OP,
+                    'id', changed.id,
+                    'table_id', changed.table_id,
+                    'start_time', changed.start_time,
+                    'end_time', changed.end_time,
+                    'status', changed.status
+                )::text
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER booking_change_notify
+        AFTER INSERT OR UPDATE OR DELETE ON booking
+        FOR EACH ROW EXECUTE FUNCTION notify_booking_change()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS booking_change_notify ON booking")
+    op.execute("DROP FUNCTION IF EXISTS notify_booking_change()")
@@ -0,0 +1,28 @@
+"""install the booking change trigger disabled
+
+Revision ID: 5b2e8d7c4a19
+Revises: 30d669172fb1
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b2e8d7c4a19"
+down_revision: Union[str, Sequence[str], None] = "30d669172fb1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The booking index listener enables it on startup.
+    op.execute("ALTER TABLE booking DISABLE TRIGGER booking_change_notify")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE booking ENABLE TRIGGER booking_change_notify")
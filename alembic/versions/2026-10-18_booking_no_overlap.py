@@ -0,0 +1,36 @@
+"""add booking exclusion constraint
+
+Revision ID: 0f80033e6a69
+Revises: 6d1b5f0a9c2e
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0f80033e6a69"
+down_revision: Union[str, Sequence[str], None] = "6d1b5f0a9c2e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.create_exclude_constraint(
+        "booking_no_overlap",
+        "booking",
+        ("table_id", "="),
+        (sa.text("tstzrange(start_time, end_time, '[)')"), "&&"),
+        where=sa.text("status = 'active'"),
+        using="gist",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("booking_no_overlap", "booking")
@@ -0,0 +1,41 @@
+"""add booking reminder_sent_at
+
+Revision ID: a64c3df6678f
+Revises: 3df14a5ae806
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a64c3df6678f"
+down_revision: Union[str, Sequence[str], None] = "3df14a5ae806"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "booking",
+        sa.Column("reminder_sent_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    # Existing bookings already have their reminders queued as Celery ETA tasks.
+    op.execute("UPDATE booking SET reminder_sent_at = created_at")
+    op.create_index(
+        "ix_booking_reminder_due",
+        "booking",
+        ["start_time"],
+        unique=False,
+        postgresql_where=sa.text("status = 'active' AND reminder_sent_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_booking_reminder_due", table_name="booking")
+    op.drop_column("booking", "reminder_sent_at")
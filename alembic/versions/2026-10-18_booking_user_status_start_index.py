@@ -0,0 +1,34 @@
+"""add booking user/status/start index
+
+Revision ID: 3df14a5ae806
+Revises: 9f4c6a1568e6
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3df14a5ae806"
+down_revision: Union[str, Sequence[str], None] = "9f4c6a1568e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_booking_user_status_start",
+        "booking",
+        ["user_id", "status", "start_time"],
+        unique=False,
+    )
+    op.drop_index(op.f("ix_booking_user_id"), table_name="booking")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f("ix_booking_user_id"), "booking", ["user_id"], unique=False)
+    op.drop_index("ix_booking_user_status_start", table_name="booking")
@@ -0,0 +1,57 @@
+"""add table retired_at and cascading booking foreign keys
+
+Revision ID: 30d669172fb1
+Revises: 0c08d1f665c5
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "30d669172fb1"
+down_revision: Union[str, Sequence[str], None] = "0c08d1f665c5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "table",
+        sa.Column("retired_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.drop_constraint("booking_table_id_fkey", "booking", type_="foreignkey")
+    op.drop_constraint("booking_user_id_fkey", "booking", type_="foreignkey")
+    op.create_foreign_key(
+        "booking_table_id_fkey",
+        "booking",
+        "table",
+        ["table_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    op.create_foreign_key(
+        "booking_user_id_fkey",
+        "booking",
+        "usr",
+        ["user_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("booking_user_id_fkey", "booking", type_="foreignkey")
+    op.drop_constraint("booking_table_id_fkey", "booking", type_="foreignkey")
+    op.create_foreign_key(
+        "booking_user_id_fkey", "booking", "usr", ["user_id"], ["id"]
+    )
+    op.create_foreign_key(
+        "booking_table_id_fkey", "booking", "table", ["table_id"], ["id"]
+    )
+    op.drop_column("table", "retired_at")
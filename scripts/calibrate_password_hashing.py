@@ -0,0 +1,49 @@
+"""Pick a bcrypt cost for this CPU and report login capacity.
+
+Prints the ``PASSWORD_BCRYPT_ROUNDS`` whose verify fits in
+``PASSWORD_TARGET_VERIFY_MS`` and how many verifies per second one API worker
+sustains with ``PASSWORD_HASH_WORKERS`` threads.
+
+With ``--startup`` only the rounds to use are printed: calibrated ones if
+``PASSWORD_CALIBRATE_ON_STARTUP`` is set, the configured ones otherwise.
+``scripts/start.sh`` runs it once before starting the workers, so they all
+share one cost measured on an idle CPU.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.core.config import settings
+from src.core.security import benchmark_password_verify, calibrate_password_rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--target-ms", type=int, default=settings.password_target_verify_ms
+    )
+    parser.add_argument("--workers", type=int, default=settings.password_hash_workers)
+    parser.add_argument("--seconds", type=float, default=3)
+    parser.add_argument("--startup", action="store_true")
+    args = parser.parse_args()
+
+    if args.startup:
+        if settings.password_calibrate_on_startup:
+            print(calibrate_password_rounds(args.target_ms))
+        else:
+            print(settings.password_bcrypt_rounds)
+        return
+
+    rounds = calibrate_password_rounds(args.target_ms)
+    print(f"PASSWORD_BCRYPT_ROUNDS={rounds}")
+    for workers in sorted({1, args.workers}):
+        rate = benchmark_password_verify(rounds, workers, args.seconds)
+        print(f"{workers} thread(s): {rate:.1f} verifies/s per API worker")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,14 @@
 import asyncio
 import os
+import sys
 
 from sqlalchemy import select
 
+from src.auth.cache import user_identity_cache
 from src.auth.models import User
+from src.auth.tokens import token_store
 from src.bookings import models as _booking_models  # noqa: F401
+from src.core.errors import ServiceUnavailableError
 from src.core.security import hash_password
 from src.db.session import SessionFactory
 from src.tables import models as _table_models  # noqa: F401
@@ -23,6 +27,16 @@ async def ensure_admin() -> None:
             if not user.is_admin:
                 user.is_admin = True
                 await session.commit()
+                await user_identity_cache.invalidate(user.id)
+                # Existing tokens carry is_admin=false; force a refresh.
+                try:
+                    await token_store.revoke_all(user.id)
+                except ServiceUnavailableError:
+                    print(
+                        f"Warning: could not revoke tokens of {email}; "
+                        "they keep is_admin=false until they expire",
+                        file=sys.stderr,
+                    )
             return
         session.add(
             User(
@@ -0,0 +1,136 @@
+"""Bulk import users from a CSV file.
+
+The CSV needs ``email``, ``password``, ``full_name`` and ``phone_number``
+columns. Rows are read in chunks; emails already in the database or earlier in
+the file are skipped before hashing, passwords are hashed in a process pool,
+and each chunk is loaded with one ``COPY`` into ``usr``.
+"""
+
+import argparse
+import asyncio
+import csv
+import os
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+from pydantic import ValidationError
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+if os.environ.get("POSTGRES_HOST") == "db" and not Path("/.dockerenv").exists():
+    os.environ["POSTGRES_HOST"] = "localhost"
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.auth.repositories import UserRepository
+from src.auth.schemas import UserCreate
+from src.bookings import models as _booking_models  # noqa: F401
+from src.core.security import hash_password
+from src.db.session import SessionFactory
+from src.tables import models as _table_models  # noqa: F401
+
+
+def hash_passwords(passwords: list[str]) -> list[str]:
+    return [hash_password(password) for password in passwords]
+
+
+def read_chunks(path: Path, chunk_size: int) -> Iterator[list[tuple[int, dict]]]:
+    with path.open(newline="", encoding="utf-8") as file:
+        # Line 1 is the header.
+        rows = enumerate(csv.DictReader(file), start=2)
+        while chunk := list(islice(rows, chunk_size)):
+            yield chunk
+
+
+async def hash_in_pool(
+    pool: ProcessPoolExecutor, passwords: list[str], parts: int
+) -> list[str]:
+    loop = asyncio.get_running_loop()
+    step = max(-(-len(passwords) // parts), 1)
+    hashed = await asyncio.gather(
+        *(
+            loop.run_in_executor(pool, hash_passwords, passwords[i : i + step])
+            for i in range(0, len(passwords), step)
+        )
+    )
+    return [hashed_password for part in hashed for hashed_password in part]
+
+
+async def import_users(
+    path: Path,
+    chunk_size: int = 5000,
+    workers: int | None = None,
+    session_factory: async_sessionmaker[AsyncSession] = SessionFactory,
+) -> dict[str, int]:
+    workers = workers or os.cpu_count() or 1
+    stats = {"read": 0, "invalid": 0, "duplicate": 0, "inserted": 0}
+    seen: set[str] = set()
+    started = time.monotonic()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in read_chunks(path, chunk_size):
+            stats["read"] += len(chunk)
+            users: list[UserCreate] = []
+            for line, row in chunk:
+                try:
+                    user = UserCreate.model_validate(row)
+                except ValidationError as error:
+                    stats["invalid"] += 1
+                    print(f"Line {line}: {error.errors()[0]['msg']}", file=sys.stderr)
+                    continue
+                if user.email in seen:
+                    stats["duplicate"] += 1
+                    continue
+                seen.add(user.email)
+                users.append(user)
+
+            # Skip known emails before paying for bcrypt; the insert itself
+            # still ignores emails registered in the meantime.
+            async with session_factory() as session:
+                existing = await UserRepository(session).existing_emails(
+                    [user.email for user in users]
+                )
+            users = [user for user in users if user.email not in existing]
+            hashed = await hash_in_pool(
+                pool, [user.password for user in users], workers
+            )
+            async with session_factory() as session:
+                inserted = await UserRepository(session).import_many(
+                    [
+                        (user.email, hashed_password, user.full_name, user.phone_number)
+                        for user, hashed_password in zip(users, hashed)
+                    ]
+                )
+
+            stats["inserted"] += inserted
+            stats["duplicate"] += len(existing) + len(users) - inserted
+            elapsed = time.monotonic() - started
+            print(
+                f"{stats['read']} rows read, {stats['inserted']} inserted, "
+                f"{stats['duplicate']} duplicate, {stats['invalid']} invalid "
+                f"({stats['read'] / elapsed:.0f} rows/s)"
+            )
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="hashing processes (default: CPU count)",
+    )
+    args = parser.parse_args()
+    asyncio.run(import_users(args.path, args.chunk_size, args.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,11 @@ if os.environ.get("POSTGRES_HOST") == "db" and not Path("/.dockerenv").exists():
 from src.auth.models import User
 from src.bookings.models import Booking
 from src.db.session import SessionFactory
+from src.tables.cache import get_availability_cache
+from src.tables.catalogue import get_table_catalogue
 from src.tables.models import Table
+from src.tables.repositories import TableRepository
+from src.tables.services import TableService
 
 TABLE_CONFIG = {
     2: 7,
@@ -30,13 +34,16 @@ async def seed_tables() -> None:
             print("Tables already exist, skipping.")
             return
 
-        tables: list[Table] = []
-        for seats, count in TABLE_CONFIG.items():
-            for index in range(1, count + 1):
-                tables.append(Table(name=f"T{seats}-{index}", seats=seats))
-
-        session.add_all(tables)
-        await session.commit()
+        service = TableService(
+            TableRepository(session), get_availability_cache(), get_table_catalogue()
+        )
+        tables = await service.create_tables(
+            [
+                (f"T{seats}-{index}", seats)
+                for seats, count in TABLE_CONFIG.items()
+                for index in range(1, count + 1)
+            ]
+        )
         print(f"Inserted {len(tables)} tables.")
 
 
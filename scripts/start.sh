@@ -8,6 +8,10 @@ PYTHONPATH=/app alembic upgrade head
 PYTHONPATH=/app python /app/scripts/seed_tables.py
 PYTHONPATH=/app python /app/scripts/create_admin.py
 
+# Calibrate once here rather than in every worker at the same time.
+PASSWORD_BCRYPT_ROUNDS=$(PYTHONPATH=/app python /app/scripts/calibrate_password_hashing.py --startup)
+export PASSWORD_BCRYPT_ROUNDS
+
 exec gunicorn src.main:app \
   --workers "$WORKERS" \
   --worker-class uvicorn.workers.UvicornWorker \
@@ -0,0 +1,98 @@
+import logging
+import time
+from collections import OrderedDict
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.auth.schemas import CurrentUser
+from src.core.config import settings
+from src.core.redis import redis_client
+
+KEY_PREFIX = "auth:user"
+
+logger = logging.getLogger("app.user_cache")
+
+
+class UserIdentityCache:
+    """Caches the identity behind an access token.
+
+    The in-process tier is an LRU of ``auth_user_cache_size`` tokens, each
+    kept for ``auth_user_cache_ttl_seconds``. With
+    ``auth_user_cache_redis_enabled`` a Redis tier keyed by user id is shared
+    by all workers. ``invalidate`` clears this worker and Redis; other
+    workers drop their copy when its TTL runs out.
+    """
+
+    def __init__(self, redis: Redis) -> None:
+        self.redis = redis
+        self._local: OrderedDict[str, tuple[float, CurrentUser]] = OrderedDict()
+
+    async def get(self, user_id: int, token: str) -> CurrentUser | None:
+        entry = self._local.get(token)
+        if entry is not None:
+            expires_at, user = entry
+            if expires_at > time.monotonic() and user.id == user_id:
+                self._local.move_to_end(token)
+                return user
+            del self._local[token]
+
+        if not settings.auth_user_cache_redis_enabled:
+            return None
+        try:
+            raw = await self.redis.get(self._key(user_id))
+        except RedisError:
+            self._log_unavailable()
+            return None
+        if raw is None:
+            return None
+        user = CurrentUser.model_validate_json(raw)
+        self._remember(token, user)
+        return user
+
+    async def set(self, token: str, user: CurrentUser) -> None:
+        self._remember(token, user)
+        if not settings.auth_user_cache_redis_enabled:
+            return
+        try:
+            await self.redis.set(
+                self._key(user.id),
+                user.model_dump_json(),
+                ex=settings.auth_user_cache_ttl_seconds,
+            )
+        except RedisError:
+            self._log_unavailable()
+
+    async def invalidate(self, user_id: int) -> None:
+        for token in [
+            token for token, (_, user) in self._local.items() if user.id == user_id
+        ]:
+            del self._local[token]
+        try:
+            await self.redis.delete(self._key(user_id))
+        except RedisError:
+            self._log_unavailable()
+
+    def clear(self) -> None:
+        self._local.clear()
+
+    def _remember(self, token: str, user: CurrentUser) -> None:
+        expires_at = time.monotonic() + settings.auth_user_cache_ttl_seconds
+        self._local[token] = (expires_at, user)
+        self._local.move_to_end(token)
+        while len(self._local) > settings.auth_user_cache_size:
+            self._local.popitem(last=False)
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"{KEY_PREFIX}:{user_id}"
+
+    @staticmethod
+    def _log_unavailable() -> None:
+        logger.warning(
+            "User cache unavailable",
+            extra={"event": "user_cache_unavailable"},
+        )
+
+
+user_identity_cache = UserIdentityCache(redis_client)
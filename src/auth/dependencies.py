@@ -2,8 +2,10 @@ from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.auth.models import User
+from src.auth.cache import user_identity_cache
 from src.auth.repositories import UserRepository
+from src.auth.schemas import CurrentUser
+from src.auth.tokens import token_store
 from src.core.errors import ForbiddenError, UnauthorizedError
 from src.core.security import decode_access_token
 from src.db.session import get_session
@@ -14,20 +16,30 @@ bearer_scheme = HTTPBearer()
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     session: AsyncSession = Depends(get_session),
-) -> User:
+) -> CurrentUser:
     try:
         payload = decode_access_token(credentials.credentials)
     except ValueError:
         raise UnauthorizedError("Invalid authentication credentials")
-    user = await UserRepository(session).get_by_id(payload.sub)
+    if payload.ver is not None and not await token_store.is_active(payload):
+        raise UnauthorizedError("Token has been revoked")
+    if payload.adm is not None:
+        return CurrentUser(id=payload.sub, is_admin=payload.adm)
+
+    # Tokens issued before access tokens carried claims.
+    user = await user_identity_cache.get(payload.sub, credentials.credentials)
+    if user:
+        return user
+    user = await UserRepository(session).get_identity(payload.sub)
     if not user:
         raise UnauthorizedError("User not found")
+    await user_identity_cache.set(credentials.credentials, user)
     return user
 
 
 async def get_current_admin(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: CurrentUser = Depends(get_current_user),
+) -> CurrentUser:
     if not current_user.is_admin:
         raise ForbiddenError("Admin access required")
     return current_user
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Boolean, Column, DateTime, MetaData, String, Table
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.base import Base
@@ -24,4 +25,29 @@ class User(Base):
         "Booking",
         back_populates="user",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
+
+
+IMPORT_COLUMNS = (
+    "email",
+    "hashed_password",
+    "full_name",
+    "phone_number",
+    "is_admin",
+    "created_at",
+)
+
+# Staging table for bulk user imports, created per import on the session's
+# connection. Its own metadata keeps it out of migrations and create_all.
+user_import = Table(
+    "usr_import",
+    MetaData(),
+    Column("email", String(256), nullable=False),
+    Column("hashed_password", String, nullable=False),
+    Column("full_name", String, nullable=False),
+    Column("phone_number", String(32), nullable=False),
+    Column("is_admin", Boolean, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    prefixes=["TEMPORARY"],
+)
@@ -1,7 +1,16 @@
-from sqlalchemy import insert, select
+from collections.abc import Sequence
+from datetime import datetime, timezone
+
+from sqlalchemy import exists, insert, select, true, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.schema import CreateTable, DropTable
+
+from src.auth.models import IMPORT_COLUMNS, User, user_import
+from src.auth.schemas import CurrentUser
+from src.db.dialects import dialect_insert
 
-from src.auth.models import User
+# asyncpg allows at most 32767 bind parameters per statement.
+EMAIL_LOOKUP_BATCH = 10000
 
 
 class UserRepository:
@@ -16,23 +25,95 @@ class UserRepository:
         result = await self.session.execute(select(User).where(User.id == user_id))
         return result.scalar_one_or_none()
 
+    async def get_identity(self, user_id: int) -> CurrentUser | None:
+        result = await self.session.execute(
+            select(User.id, User.is_admin).where(User.id == user_id)
+        )
+        row = result.one_or_none()
+        return None if row is None else CurrentUser(id=row.id, is_admin=row.is_admin)
+
+    async def email_exists(self, email: str) -> bool:
+        result = await self.session.execute(select(exists().where(User.email == email)))
+        return bool(result.scalar())
+
+    async def existing_emails(self, emails: Sequence[str]) -> set[str]:
+        existing: set[str] = set()
+        for offset in range(0, len(emails), EMAIL_LOOKUP_BATCH):
+            batch = emails[offset : offset + EMAIL_LOOKUP_BATCH]
+            result = await self.session.execute(
+                select(User.email).where(User.email.in_(batch))
+            )
+            existing.update(result.scalars().all())
+        return existing
+
+    async def import_many(self, users: list[tuple[str, str, str, str]]) -> int:
+        """Bulk insert ``(email, hashed_password, full_name, phone_number)`` rows.
+
+        Rows are loaded into a temporary table (with ``COPY`` on PostgreSQL)
+        and moved into ``usr`` by one ``INSERT ... SELECT`` that skips taken
+        emails. Returns the number of users inserted.
+        """
+        if not users:
+            return 0
+        now = datetime.now(timezone.utc)
+        records = [(*user, False, now) for user in users]
+        await self.session.execute(CreateTable(user_import))
+        if self.session.get_bind().dialect.name == "postgresql":
+            connection = await self.session.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                user_import.name, records=records, columns=IMPORT_COLUMNS
+            )
+        else:
+            await self.session.execute(
+                insert(user_import),
+                [dict(zip(IMPORT_COLUMNS, record)) for record in records],
+            )
+        result = await self.session.execute(
+            dialect_insert(self.session, User)
+            .from_select(
+                IMPORT_COLUMNS,
+                # SQLite needs a WHERE to parse ON CONFLICT after a SELECT.
+                select(*(user_import.c[name] for name in IMPORT_COLUMNS)).where(true()),
+            )
+            .on_conflict_do_nothing(index_elements=[User.email])
+        )
+        await self.session.execute(DropTable(user_import))
+        await self.session.commit()
+        return result.rowcount
+
     async def create(
         self,
         email: str,
         hashed_password: str,
         full_name: str,
         phone_number: str,
-    ) -> int:
+    ) -> int | None:
+        """Insert a user; returns None if the email is already taken."""
         stmt = (
-            insert(User)
+            dialect_insert(self.session, User)
             .values(
                 email=email,
                 hashed_password=hashed_password,
                 full_name=full_name,
                 phone_number=phone_number,
             )
+            .on_conflict_do_nothing(index_elements=[User.email])
             .returning(User.id)
         )
         result = await self.session.execute(stmt)
+        user_id = result.scalar_one_or_none()
+        await self.session.commit()
+        return user_id
+
+    async def update_password_hash(
+        self, user_id: int, old_hash: str, new_hash: str
+    ) -> bool:
+        """Replace a password hash unless it was changed in the meantime."""
+        result = await self.session.execute(
+            update(User)
+            .where(User.id == user_id, User.hashed_password == old_hash)
+            .values(hashed_password=new_hash)
+        )
         await self.session.commit()
-        return result.scalar_one()
+        return result.rowcount > 0
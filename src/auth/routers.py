@@ -1,38 +1,89 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.repositories import UserRepository
-from src.auth.schemas import Token, UserCreate, UserLogin
+from src.auth.schemas import RefreshRequest, Token, UserCreate, UserLogin
 from src.auth.services import AuthService
+from src.auth.throttle import get_auth_throttle
+from src.auth.tokens import token_store
 from src.core.logging_decorators import log_endpoint
 from src.db.session import get_session
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def client_ip(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+
 @router.post(
     "/register",
     response_model=Token,
     summary="Register a new user",
-    description="Creates a user account and returns a bearer access token.",
+    description=(
+        "Creates a user account and returns access and refresh tokens. "
+        "Rate limited per client IP and email (429 with Retry-After)."
+    ),
 )
 @log_endpoint
 async def register(
-    payload: UserCreate, session: AsyncSession = Depends(get_session)
+    payload: UserCreate,
+    request: Request,
+    session: AsyncSession = Depends(get_session),
 ) -> Token:
-    service = AuthService(UserRepository(session))
-    return await service.register(payload)
+    service = AuthService(UserRepository(session), get_auth_throttle(), token_store)
+    return await service.register(payload, client_ip(request))
 
 
 @router.post(
     "/login",
     response_model=Token,
     summary="Log in and get a token",
-    description="Validates user credentials and returns a bearer access token.",
+    description=(
+        "Validates user credentials and returns access and refresh tokens. "
+        "Rate limited per client IP and email; repeated failures back off "
+        "exponentially (429 with Retry-After). Password hashes made with an "
+        "outdated scheme or cost are upgraded in the background."
+    ),
 )
 @log_endpoint
 async def login(
-    payload: UserLogin, session: AsyncSession = Depends(get_session)
+    payload: UserLogin,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(get_session),
+) -> Token:
+    service = AuthService(UserRepository(session), get_auth_throttle(), token_store)
+    return await service.login(payload, client_ip(request), background_tasks)
+
+
+@router.post(
+    "/refresh",
+    response_model=Token,
+    summary="Refresh tokens",
+    description=(
+        "Exchanges a refresh token for a new access and refresh token pair. "
+        "Each refresh token can be used once."
+    ),
+)
+@log_endpoint
+async def refresh(
+    payload: RefreshRequest, session: AsyncSession = Depends(get_session)
 ) -> Token:
-    service = AuthService(UserRepository(session))
-    return await service.login(payload)
+    service = AuthService(UserRepository(session), tokens=token_store)
+    return await service.refresh(payload.refresh_token)
+
+
+@router.post(
+    "/logout",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Log out",
+    description="Revokes a refresh token.",
+)
+@log_endpoint
+async def logout(
+    payload: RefreshRequest, session: AsyncSession = Depends(get_session)
+) -> Response:
+    service = AuthService(UserRepository(session), tokens=token_store)
+    await service.logout(payload.refresh_token)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 class UserCreate(BaseModel):
@@ -20,6 +20,13 @@ class UserRead(BaseModel):
     full_name: str
 
 
+class CurrentUser(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    id: int
+    is_admin: bool
+
+
 class Token(BaseModel):
     access_token: str = Field(
         examples=[
@@ -27,8 +34,18 @@ class Token(BaseModel):
             "OTk5OTk5fQ.k5p9Z0pQmFQyCthdxn8t2aY3bY2tI3oUsy1B3uDgT5M"
         ]
     )
+    refresh_token: str
     token_type: str = "bearer"
 
 
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+
 class TokenPayload(BaseModel):
     sub: int
+    exp: int
+    typ: str = "access"
+    jti: str | None = None
+    ver: int | None = None
+    adm: bool | None = None
@@ -1,36 +1,122 @@
+import logging
+
+from fastapi import BackgroundTasks
+
 from src.auth.repositories import UserRepository
-from src.auth.schemas import Token, UserCreate, UserLogin
+from src.auth.schemas import Token, TokenPayload, UserCreate, UserLogin
+from src.auth.throttle import AuthThrottle
+from src.auth.tokens import TokenStore
 from src.core.errors import BusinessError, UnauthorizedError
 from src.core.logging_decorators import log_service
-from src.core.security import create_access_token, hash_password, verify_password
+from src.core.security import (
+    create_access_token,
+    create_refresh_token,
+    decode_refresh_token,
+    hash_password_async,
+    password_needs_rehash,
+    verify_password_async,
+)
 from src.tasks.tasks import send_welcome_email
 
+logger = logging.getLogger("app.auth")
+
 
 class AuthService:
-    def __init__(self, users: UserRepository) -> None:
+    def __init__(
+        self,
+        users: UserRepository,
+        throttle: AuthThrottle | None = None,
+        tokens: TokenStore | None = None,
+    ) -> None:
         self.users = users
+        self.throttle = throttle
+        self.tokens = tokens
 
     @log_service
-    async def register(self, data: UserCreate) -> Token:
+    async def register(self, data: UserCreate, client_ip: str = "unknown") -> Token:
+        if self.throttle:
+            await self.throttle.check("register", client_ip, data.email)
         await self.validate_email(data.email)
         user_id = await self.users.create(
             email=data.email,
-            hashed_password=hash_password(data.password),
+            hashed_password=await hash_password_async(data.password),
             full_name=data.full_name,
             phone_number=data.phone_number,
         )
+        if user_id is None:
+            # Lost a race with a concurrent registration for the same email.
+            raise BusinessError("Email already registered")
         send_welcome_email.delay(data.email, data.full_name)
-        return Token(access_token=create_access_token(user_id))
+        return await self._issue_tokens(user_id, is_admin=False)
 
     @log_service
-    async def login(self, data: UserLogin) -> Token:
+    async def login(
+        self,
+        data: UserLogin,
+        client_ip: str = "unknown",
+        background_tasks: BackgroundTasks | None = None,
+    ) -> Token:
+        if self.throttle:
+            await self.throttle.check("login", client_ip, data.email)
         user = await self.users.get_by_email(data.email)
-        if not user or not verify_password(data.password, user.hashed_password):
+        if not user or not await verify_password_async(
+            data.password, user.hashed_password
+        ):
+            if self.throttle:
+                await self.throttle.record_failure(client_ip, data.email)
             raise UnauthorizedError("Invalid email or password")
-        return Token(access_token=create_access_token(user.id))
+        if self.throttle:
+            await self.throttle.reset(data.email)
+        if background_tasks and password_needs_rehash(user.hashed_password):
+            background_tasks.add_task(
+                self.rehash_password, user.id, user.hashed_password, data.password
+            )
+        return await self._issue_tokens(user.id, user.is_admin)
+
+    @log_service
+    async def refresh(self, refresh_token: str) -> Token:
+        payload = await self._read_refresh_token(refresh_token)
+        user = await self.users.get_identity(payload.sub)
+        if not user:
+            raise UnauthorizedError("User not found")
+        # Rotation: a refresh token is good for exactly one refresh.
+        if self.tokens and not await self.tokens.revoke(payload):
+            raise UnauthorizedError("Refresh token has been revoked")
+        return await self._issue_tokens(user.id, user.is_admin)
+
+    @log_service
+    async def logout(self, refresh_token: str) -> None:
+        payload = await self._read_refresh_token(refresh_token)
+        if self.tokens:
+            await self.tokens.revoke(payload)
 
     @log_service
     async def validate_email(self, email: str) -> None:
-        existing = await self.users.get_by_email(email)
-        if existing:
+        if await self.users.email_exists(email):
             raise BusinessError("Email already registered")
+
+    @log_service
+    async def rehash_password(self, user_id: int, old_hash: str, password: str) -> None:
+        """Upgrade a hash made with a deprecated scheme or too few rounds."""
+        new_hash = await hash_password_async(password)
+        if await self.users.update_password_hash(user_id, old_hash, new_hash):
+            logger.info(
+                "Password hash upgraded",
+                extra={"event": "password_rehashed", "user_id": user_id},
+            )
+
+    async def _issue_tokens(self, user_id: int, is_admin: bool) -> Token:
+        version = await self.tokens.current_version(user_id) if self.tokens else 0
+        return Token(
+            access_token=create_access_token(user_id, is_admin, version),
+            refresh_token=create_refresh_token(user_id, version),
+        )
+
+    async def _read_refresh_token(self, refresh_token: str) -> TokenPayload:
+        try:
+            payload = decode_refresh_token(refresh_token)
+        except ValueError:
+            raise UnauthorizedError("Invalid refresh token")
+        if self.tokens and not await self.tokens.is_active(payload):
+            raise UnauthorizedError("Refresh token has been revoked")
+        return payload
@@ -0,0 +1,140 @@
+import logging
+import math
+import time
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.core.config import settings
+from src.core.errors import TooManyRequestsError
+from src.core.redis import redis_client
+
+KEY_PREFIX = "auth"
+
+logger = logging.getLogger("app.auth_throttle")
+
+# KEYS: ip bucket, email bucket, ip lock, email lock.
+# ARGV: now ms, then capacity and refill-per-minute for each bucket.
+# Consumes a token from both buckets only if neither is empty and no lock is
+# set; returns 0 when allowed, otherwise the wait in milliseconds.
+CHECK_SCRIPT = """
+local now = tonumber(ARGV[1])
+local retry = math.max(redis.call('PTTL', KEYS[3]), redis.call('PTTL', KEYS[4]), 0)
+local buckets = {}
+for i = 1, 2 do
+  local capacity = tonumber(ARGV[i * 2])
+  local rate = tonumber(ARGV[i * 2 + 1]) / 60000
+  local state = redis.call('HMGET', KEYS[i], 'tokens', 'ts')
+  local tokens = tonumber(state[1]) or capacity
+  local ts = tonumber(state[2]) or now
+  tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+  if tokens < 1 then
+    retry = math.max(retry, math.ceil((1 - tokens) / rate))
+  end
+  buckets[i] = {tokens, capacity / rate}
+end
+if retry == 0 then
+  for i = 1, 2 do
+    redis.call('HSET', KEYS[i], 'tokens', buckets[i][1] - 1, 'ts', now)
+    redis.call('PEXPIRE', KEYS[i], math.ceil(buckets[i][2]))
+  end
+end
+return retry
+"""
+
+# KEYS: strikes counter, lock. ARGV: free failures, base seconds, max seconds.
+# Every failure past the free ones doubles the lock, up to the maximum.
+FAILURE_SCRIPT = """
+local strikes = redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+local over = strikes - tonumber(ARGV[1])
+if over >= 0 then
+  local lock = math.min(tonumber(ARGV[3]), tonumber(ARGV[2]) * 2 ^ over)
+  redis.call('SET', KEYS[2], 1, 'EX', math.ceil(lock))
+end
+return strikes
+"""
+
+
+class AuthThrottle:
+    """Token buckets per client IP and per email for the auth endpoints.
+
+    Each action has its own buckets. Failed logins add strikes to the IP and
+    the email; from the ``auth_backoff_after_failures``-th strike on, each
+    failure locks them out for twice as long as the previous one. When Redis is
+    unavailable requests are let through.
+    """
+
+    def __init__(self, redis: Redis) -> None:
+        self.redis = redis
+        self._check = redis.register_script(CHECK_SCRIPT)
+        self._failure = redis.register_script(FAILURE_SCRIPT)
+
+    async def check(self, action: str, client_ip: str, email: str) -> None:
+        ip, email = f"ip:{client_ip}", f"email:{email.lower()}"
+        try:
+            retry_ms = await self._check(
+                keys=[
+                    f"{KEY_PREFIX}:bucket:{action}:{ip}",
+                    f"{KEY_PREFIX}:bucket:{action}:{email}",
+                    f"{KEY_PREFIX}:lock:{ip}",
+                    f"{KEY_PREFIX}:lock:{email}",
+                ],
+                args=[
+                    int(time.time() * 1000),
+                    settings.auth_throttle_ip_capacity,
+                    settings.auth_throttle_ip_refill_per_minute,
+                    settings.auth_throttle_email_capacity,
+                    settings.auth_throttle_email_refill_per_minute,
+                ],
+            )
+        except RedisError:
+            self._log_unavailable()
+            return
+        if retry_ms:
+            raise TooManyRequestsError(
+                "Too many attempts, try again later",
+                retry_after=math.ceil(int(retry_ms) / 1000),
+            )
+
+    async def record_failure(self, client_ip: str, email: str) -> None:
+        try:
+            for identity in (f"ip:{client_ip}", f"email:{email.lower()}"):
+                await self._failure(
+                    keys=[
+                        f"{KEY_PREFIX}:strikes:{identity}",
+                        f"{KEY_PREFIX}:lock:{identity}",
+                    ],
+                    args=[
+                        settings.auth_backoff_after_failures,
+                        settings.auth_backoff_base_seconds,
+                        settings.auth_backoff_max_seconds,
+                    ],
+                )
+        except RedisError:
+            self._log_unavailable()
+
+    async def reset(self, email: str) -> None:
+        identity = f"email:{email.lower()}"
+        try:
+            await self.redis.delete(
+                f"{KEY_PREFIX}:strikes:{identity}", f"{KEY_PREFIX}:lock:{identity}"
+            )
+        except RedisError:
+            self._log_unavailable()
+
+    @staticmethod
+    def _log_unavailable() -> None:
+        logger.warning(
+            "Auth throttle unavailable",
+            extra={"event": "auth_throttle_unavailable"},
+        )
+
+
+auth_throttle = AuthThrottle(redis_client)
+
+
+def get_auth_throttle() -> AuthThrottle | None:
+    if not settings.auth_throttle_enabled:
+        return None
+    return auth_throttle
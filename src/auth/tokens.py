@@ -0,0 +1,82 @@
+import logging
+import time
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.auth.schemas import TokenPayload
+from src.core.errors import ServiceUnavailableError
+from src.core.redis import redis_client
+
+KEY_PREFIX = "auth"
+
+logger = logging.getLogger("app.token_store")
+
+
+class TokenStore:
+    """Token revocation state in Redis.
+
+    Revoked token ids are kept until the token would have expired anyway.
+    Each user also has a token version; bumping it invalidates every token
+    issued before, which is the kill switch for a compromised account. When
+    Redis is unavailable tokens are accepted on their signature alone, but
+    revoking fails with ``ServiceUnavailableError``: a refresh token must not
+    be reusable and a logout or kill switch must not silently do nothing.
+    """
+
+    def __init__(self, redis: Redis) -> None:
+        self.redis = redis
+
+    async def current_version(self, user_id: int) -> int:
+        try:
+            raw = await self.redis.get(self._version_key(user_id))
+        except RedisError:
+            self._log_unavailable()
+            return 0
+        return int(raw or 0)
+
+    async def is_active(self, payload: TokenPayload) -> bool:
+        try:
+            revoked, version = await self.redis.mget(
+                self._revoked_key(payload.jti), self._version_key(payload.sub)
+            )
+        except RedisError:
+            self._log_unavailable()
+            return True
+        return revoked is None and (payload.ver or 0) >= int(version or 0)
+
+    async def revoke(self, payload: TokenPayload) -> bool:
+        """Revoke a token; returns False if it was already revoked."""
+        ttl = max(payload.exp - int(time.time()), 1)
+        try:
+            return bool(
+                await self.redis.set(self._revoked_key(payload.jti), 1, ex=ttl, nx=True)
+            )
+        except RedisError as exc:
+            self._log_unavailable()
+            raise ServiceUnavailableError("Token store unavailable") from exc
+
+    async def revoke_all(self, user_id: int) -> None:
+        try:
+            await self.redis.incr(self._version_key(user_id))
+        except RedisError as exc:
+            self._log_unavailable()
+            raise ServiceUnavailableError("Token store unavailable") from exc
+
+    @staticmethod
+    def _revoked_key(jti: str | None) -> str:
+        return f"{KEY_PREFIX}:revoked:{jti}"
+
+    @staticmethod
+    def _version_key(user_id: int) -> str:
+        return f"{KEY_PREFIX}:token_version:{user_id}"
+
+    @staticmethod
+    def _log_unavailable() -> None:
+        logger.warning(
+            "Token store unavailable",
+            extra={"event": "token_store_unavailable"},
+        )
+
+
+token_store = TokenStore(redis_client)
@@ -0,0 +1,95 @@
+import bisect
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+
+from src.core.time_utils import to_utc
+
+Interval = tuple[datetime, datetime, int]
+
+
+class BookingIndex:
+    """Per-worker index of active bookings, keyed by table id.
+
+    Intervals are kept sorted by start time, so overlap checks only look at
+    bookings that start within ``max_duration`` before the requested end.
+    """
+
+    def __init__(self) -> None:
+        self.ready = False
+        self._by_table: dict[int, list[Interval]] = {}
+        self._by_id: dict[int, tuple[int, Interval]] = {}
+        self._max_duration = timedelta(0)
+
+    def load(self, rows: Iterable[tuple[int, int, datetime, datetime]]) -> None:
+        self._by_table = {}
+        self._by_id = {}
+        self._max_duration = timedelta(0)
+        for booking_id, table_id, start_time, end_time in rows:
+            self._add(booking_id, table_id, to_utc(start_time), to_utc(end_time))
+        for intervals in self._by_table.values():
+            intervals.sort()
+        self.ready = True
+
+    def upsert(
+        self,
+        booking_id: int,
+        table_id: int,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> None:
+        self.remove(booking_id)
+        self._add(booking_id, table_id, to_utc(start_time), to_utc(end_time), True)
+
+    def remove(self, booking_id: int) -> None:
+        entry = self._by_id.pop(booking_id, None)
+        if entry is None:
+            return
+        table_id, interval = entry
+        intervals = self._by_table[table_id]
+        intervals.pop(bisect.bisect_left(intervals, interval))
+
+    def has_conflict(
+        self,
+        table_id: int,
+        start_time: datetime,
+        end_time: datetime,
+        exclude_booking_id: int | None = None,
+    ) -> bool:
+        intervals = self._by_table.get(table_id)
+        if not intervals:
+            return False
+        start_time = to_utc(start_time)
+        end_time = to_utc(end_time)
+        low = bisect.bisect_left(intervals, (start_time - self._max_duration,))
+        high = bisect.bisect_left(intervals, (end_time,))
+        return any(
+            busy_end > start_time and booking_id != exclude_booking_id
+            for _busy_start, busy_end, booking_id in intervals[low:high]
+        )
+
+    def busy_tables(self, start_time: datetime, end_time: datetime) -> set[int]:
+        return {
+            table_id
+            for table_id in self._by_table
+            if self.has_conflict(table_id, start_time, end_time)
+        }
+
+    def _add(
+        self,
+        booking_id: int,
+        table_id: int,
+        start_time: datetime,
+        end_time: datetime,
+        keep_sorted: bool = False,
+    ) -> None:
+        interval = (start_time, end_time, booking_id)
+        intervals = self._by_table.setdefault(table_id, [])
+        if keep_sorted:
+            bisect.insort(intervals, interval)
+        else:
+            intervals.append(interval)
+        self._by_id[booking_id] = (table_id, interval)
+        self._max_duration = max(self._max_duration, end_time - start_time)
+
+
+booking_index = BookingIndex()
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.bookings.index import BookingIndex, booking_index
+from src.bookings.repositories import BookingRepository
+from src.core.config import settings
+from src.core.time_utils import utc_now
+from src.db.session import SessionFactory, engine
+
+NOTIFY_CHANNEL = "booking_changes"
+NOTIFY_TRIGGER = "booking_change_notify"
+
+logger = logging.getLogger("app.booking_index")
+
+
+class BookingIndexListener:
+    """Loads the booking index and keeps it fresh via LISTEN/NOTIFY.
+
+    The index is rebuilt every ``booking_index_refresh_seconds`` to prune
+    finished bookings and recover from notifications lost on reconnect.
+    The notify trigger is installed disabled so deployments without the
+    index pay nothing per write; ``start`` enables it.
+    """
+
+    def __init__(self, index: BookingIndex) -> None:
+        self.index = index
+        self._connection: AsyncConnection | None = None
+        self._driver_connection: Any = None
+        self._pending: list[dict[str, Any]] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        await self._enable_trigger()
+        await self._listen()
+        await self.reload()
+        self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        self.index.ready = False
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self._close()
+
+    async def reload(self) -> None:
+        self._pending = []
+        try:
+            now = utc_now()
+            horizon = now + timedelta(days=settings.booking_max_days_ahead + 1)
+            async with SessionFactory() as session:
+                rows = await BookingRepository(session).list_active_between(
+                    now, horizon
+                )
+            self.index.load(rows)
+            for payload in self._pending:
+                self._apply(payload)
+        finally:
+            self._pending = None
+        logger.info(
+            "Booking index loaded",
+            extra={"event": "booking_index_loaded", "bookings": len(rows)},
+        )
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.booking_index_refresh_seconds)
+            try:
+                connection = self._driver_connection
+                if connection is None or connection.is_closed():
+                    self.index.ready = False
+                    await self._close()
+                    await self._listen()
+                await self.reload()
+            except Exception:
+                self.index.ready = False
+                logger.exception(
+                    "Booking index refresh failed",
+                    extra={"event": "booking_index_error"},
+                )
+
+    async def _enable_trigger(self) -> None:
+        # ALTER TABLE takes a lock that blocks writes, so skip it once any
+        # worker has enabled the trigger.
+        async with engine.begin() as connection:
+            disabled = await connection.scalar(
+                text(
+                    "SELECT tgenabled = 'D' FROM pg_trigger "
+                    "WHERE tgrelid = 'booking'::regclass AND tgname = :name"
+                ),
+                {"name": NOTIFY_TRIGGER},
+            )
+            if disabled:
+                await connection.execute(
+                    text(f"ALTER TABLE booking ENABLE TRIGGER {NOTIFY_TRIGGER}")
+                )
+
+    async def _listen(self) -> None:
+        self._connection = await engine.connect()
+        raw_connection = await self._connection.get_raw_connection()
+        self._driver_connection = raw_connection.driver_connection
+        await self._driver_connection.add_listener(NOTIFY_CHANNEL, self._on_notify)
+
+    async def _close(self) -> None:
+        if self._connection is not None:
+            await self._connection.close()
+        self._connection = None
+        self._driver_connection = None
+
+    def _on_notify(
+        self, _connection: Any, _pid: int, _channel: str, payload: str
+    ) -> None:
+        data = json.loads(payload)
+        if self._pending is not None:
+            self._pending.append(data)
+        self._apply(data)
+
+    def _apply(self, data: dict[str, Any]) -> None:
+        if data["op"] == "DELETE" or data["status"] != "active":
+            self.index.remove(data["id"])
+            return
+        self.index.upsert(
+            data["id"],
+            data["table_id"],
+            datetime.fromisoformat(data["start_time"]),
+            datetime.fromisoformat(data["end_time"]),
+        )
+
+
+booking_index_listener = BookingIndexListener(booking_index)
@@ -4,7 +4,8 @@ from datetime import datetime
 from enum import StrEnum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, ForeignKey
+from sqlalchemy import DDL, DateTime, Enum, ForeignKey, Index, event, text
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.base import Base
@@ -21,8 +22,40 @@ class BookingStatus(StrEnum):
 
 
 class Booking(Base):
-    user_id: Mapped[int] = mapped_column(ForeignKey("usr.id"), index=True)
-    table_id: Mapped[int] = mapped_column(ForeignKey("table.id"), index=True)
+    __table_args__ = (
+        Index("ix_booking_user_status_start", "user_id", "status", "start_time"),
+        Index(
+            "ix_booking_reminder_due",
+            "start_time",
+            postgresql_where=text("status = 'active' AND reminder_sent_at IS NULL"),
+        ),
+        Index(
+            "ix_booking_active_table_end",
+            "table_id",
+            "end_time",
+            "start_time",
+            postgresql_where=text("status = 'active'"),
+        ),
+        Index(
+            "ix_booking_active_end",
+            "end_time",
+            "start_time",
+            postgresql_where=text("status = 'active'"),
+        ),
+        # Mirrors the booking_no_overlap migration; SQLite has no EXCLUDE.
+        ExcludeConstraint(
+            ("table_id", "="),
+            (text("tstzrange(start_time, end_time, '[)')"), "&&"),
+            name="booking_no_overlap",
+            using="gist",
+            where=text("status = 'active'"),
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("usr.id", ondelete="CASCADE"))
+    table_id: Mapped[int] = mapped_column(
+        ForeignKey("table.id", ondelete="CASCADE"), index=True
+    )
     start_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
     end_time: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     status: Mapped[BookingStatus] = mapped_column(
@@ -33,7 +66,15 @@ class Booking(Base):
         ),
         default=BookingStatus.ACTIVE,
     )
+    reminder_sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[created_at]
 
     user: Mapped["User"] = relationship("User", back_populates="bookings")
     table: Mapped["Table"] = relationship("Table", back_populates="bookings")
+
+
+event.listen(
+    Booking.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist").execute_if(dialect="postgresql"),
+)
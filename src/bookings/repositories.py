@@ -1,11 +1,31 @@
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
+from typing import NoReturn
 
-from sqlalchemy import insert, select
+from sqlalchemy import (
+    DateTime,
+    Row,
+    and_,
+    insert,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from src.auth.models import User
 from src.bookings.models import Booking, BookingStatus
+from src.core.errors import BusinessError, NotFoundError
 from src.core.time_utils import utc_now
+from src.db.errors import (
+    EXCLUSION_VIOLATION,
+    FOREIGN_KEY_VIOLATION,
+    get_sqlstate,
+)
+from src.tables.models import Table
 
 
 class BookingRepository:
@@ -14,41 +34,82 @@ class BookingRepository:
 
     async def get_by_id(self, booking_id: int) -> Booking | None:
         result = await self.session.execute(
-            select(Booking)
-            .where(Booking.id == booking_id)
-            .options(selectinload(Booking.user))
+            select(Booking).where(Booking.id == booking_id)
         )
         return result.scalar_one_or_none()
 
-    async def list_future_for_user(self, user_id: int) -> list[Booking]:
-        now = utc_now()
-        result = await self.session.execute(
+    async def list_for_user(
+        self,
+        user_id: int,
+        statuses: list[BookingStatus],
+        limit: int,
+        starts_from: datetime | None = None,
+        starts_before: datetime | None = None,
+        after: tuple[datetime, int] | None = None,
+        descending: bool = False,
+    ) -> list[Booking]:
+        stmt = (
             select(Booking)
             .where(Booking.user_id == user_id)
-            .where(Booking.status == BookingStatus.ACTIVE)
-            .where(Booking.start_time >= now)
-            .order_by(Booking.start_time)
+            .where(Booking.status.in_(statuses))
         )
+        if starts_from is not None:
+            stmt = stmt.where(Booking.start_time >= starts_from)
+        if starts_before is not None:
+            stmt = stmt.where(Booking.start_time < starts_before)
+        key = tuple_(Booking.start_time, Booking.id)
+        if descending:
+            if after is not None:
+                stmt = stmt.where(key < tuple_(*after))
+            stmt = stmt.order_by(Booking.start_time.desc(), Booking.id.desc())
+        else:
+            if after is not None:
+                stmt = stmt.where(key > tuple_(*after))
+            stmt = stmt.order_by(Booking.start_time, Booking.id)
+        result = await self.session.execute(stmt.limit(limit))
         return list(result.scalars().all())
 
-    async def has_conflict(
+    async def stream_export(
+        self,
+        statuses: list[BookingStatus],
+        starts_from: datetime | None = None,
+        starts_before: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Row]]:
+        stmt = (
+            select(
+                Booking.id,
+                Booking.user_id,
+                Booking.table_id,
+                Booking.start_time,
+                Booking.end_time,
+                Booking.status,
+                Booking.created_at,
+            )
+            .where(Booking.status.in_(statuses))
+            .order_by(Booking.start_time, Booking.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if starts_from is not None:
+            stmt = stmt.where(Booking.start_time >= starts_from)
+        if starts_before is not None:
+            stmt = stmt.where(Booking.start_time < starts_before)
+        result = await self.session.stream(stmt)
+        async for rows in result.partitions():
+            yield rows
+
+    async def list_active_between(
         self,
-        table_id: int,
         start_time: datetime,
         end_time: datetime,
-        exclude_booking_id: int | None = None,
-    ) -> bool:
-        stmt = (
-            select(Booking.id)
-            .where(Booking.table_id == table_id)
+    ) -> list[tuple[int, int, datetime, datetime]]:
+        result = await self.session.execute(
+            select(Booking.id, Booking.table_id, Booking.start_time, Booking.end_time)
             .where(Booking.status == BookingStatus.ACTIVE)
             .where(Booking.start_time < end_time)
             .where(Booking.end_time > start_time)
         )
-        if exclude_booking_id is not None:
-            stmt = stmt.where(Booking.id != exclude_booking_id)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none() is not None
+        return [tuple(row) for row in result.all()]
 
     async def create(
         self,
@@ -56,37 +117,206 @@ class BookingRepository:
         table_id: int,
         start_time: datetime,
         end_time: datetime,
-    ) -> int:
+        reminder_cutoff: datetime,
+    ) -> Booking:
+        # Inserting from a SELECT on the table skips retired tables in the
+        # same round trip; no row back means there is nothing to book.
+        bookable_table = select(
+            literal(user_id),
+            Table.id,
+            literal(start_time, DateTime(timezone=True)),
+            literal(end_time, DateTime(timezone=True)),
+            literal(BookingStatus.ACTIVE, Booking.status.type),
+            literal(
+                self._reminder_sent_at(start_time, reminder_cutoff),
+                DateTime(timezone=True),
+            ),
+            literal(utc_now(), DateTime(timezone=True)),
+        ).where(Table.id == table_id, Table.retired_at.is_(None))
         stmt = (
             insert(Booking)
-            .values(
-                user_id=user_id,
-                table_id=table_id,
-                start_time=start_time,
-                end_time=end_time,
-                status=BookingStatus.ACTIVE,
+            .from_select(
+                [
+                    Booking.user_id,
+                    Booking.table_id,
+                    Booking.start_time,
+                    Booking.end_time,
+                    Booking.status,
+                    Booking.reminder_sent_at,
+                    Booking.created_at,
+                ],
+                bookable_table,
+            )
+            .returning(Booking)
+        )
+        try:
+            result = await self.session.execute(stmt)
+        except IntegrityError as exc:
+            await self._raise_integrity_error(exc)
+        booking = result.scalar_one_or_none()
+        if not booking:
+            await self.session.rollback()
+            raise NotFoundError("Table not found")
+        await self.session.commit()
+        return booking
+
+    async def list_conflicts(
+        self,
+        slots: list[tuple[int, datetime, datetime]],
+    ) -> list[tuple[int, datetime, datetime]]:
+        stmt = (
+            select(Booking.table_id, Booking.start_time, Booking.end_time)
+            .where(Booking.status == BookingStatus.ACTIVE)
+            .where(
+                or_(
+                    *(
+                        and_(
+                            Booking.table_id == table_id,
+                            Booking.start_time < end_time,
+                            Booking.end_time > start_time,
+                        )
+                        for table_id, start_time, end_time in slots
+                    )
+                )
             )
-            .returning(Booking.id)
         )
         result = await self.session.execute(stmt)
-        booking_id = result.scalar_one()
+        return [(table_id, start, end) for table_id, start, end in result.all()]
+
+    async def create_many(
+        self,
+        user_id: int,
+        slots: list[tuple[int, datetime, datetime]],
+        reminder_cutoff: datetime,
+    ) -> list[Booking]:
+        stmt = insert(Booking).returning(Booking, sort_by_parameter_order=True)
+        params = [
+            {
+                "user_id": user_id,
+                "table_id": table_id,
+                "start_time": start_time,
+                "end_time": end_time,
+                "status": BookingStatus.ACTIVE,
+                "reminder_sent_at": self._reminder_sent_at(start_time, reminder_cutoff),
+            }
+            for table_id, start_time, end_time in slots
+        ]
+        try:
+            result = await self.session.execute(stmt, params)
+        except IntegrityError as exc:
+            await self._raise_integrity_error(exc)
+        bookings = list(result.scalars().all())
         await self.session.commit()
-        return booking_id
+        return bookings
 
     async def update_time(
         self,
-        booking: Booking,
+        booking_id: int,
+        user_id: int,
         start_time: datetime,
         end_time: datetime,
-    ) -> Booking:
-        booking.start_time = start_time
-        booking.end_time = end_time
+        reminder_cutoff: datetime,
+    ) -> tuple[Booking, datetime, datetime] | None:
+        """Move a booking; returns it with its previous start and end time."""
+        # The row lock keeps the old times valid until the update commits.
+        previous = (
+            await self.session.execute(
+                select(Booking.start_time, Booking.end_time)
+                .where(Booking.id == booking_id)
+                .where(Booking.user_id == user_id)
+                .with_for_update()
+            )
+        ).one_or_none()
+        if previous is None:
+            await self.session.rollback()
+            return None
+        stmt = (
+            update(Booking)
+            .where(Booking.id == booking_id)
+            .where(
+                Booking.table_id.in_(select(Table.id).where(Table.retired_at.is_(None)))
+            )
+            .values(
+                start_time=start_time,
+                end_time=end_time,
+                reminder_sent_at=self._reminder_sent_at(start_time, reminder_cutoff),
+            )
+            .returning(Booking)
+        )
+        try:
+            result = await self.session.execute(stmt)
+        except IntegrityError as exc:
+            await self._raise_integrity_error(exc)
+        booking = result.scalar_one_or_none()
+        if not booking:
+            await self.session.rollback()
+            raise NotFoundError("Table not found")
         await self.session.commit()
-        await self.session.refresh(booking)
-        return booking
+        return booking, previous.start_time, previous.end_time
 
-    async def cancel(self, booking: Booking) -> Booking:
-        booking.status = BookingStatus.CANCELED
+    async def cancel(
+        self,
+        booking_id: int,
+        user_id: int,
+        starts_after: datetime,
+    ) -> Booking | None:
+        stmt = (
+            update(Booking)
+            .where(Booking.id == booking_id)
+            .where(Booking.user_id == user_id)
+            .where(Booking.start_time >= starts_after)
+            .values(status=BookingStatus.CANCELED)
+            .returning(Booking)
+        )
+        result = await self.session.execute(stmt)
+        booking = result.scalar_one_or_none()
         await self.session.commit()
-        await self.session.refresh(booking)
         return booking
+
+    async def claim_due_reminders(
+        self,
+        due_before: datetime,
+        limit: int,
+    ) -> list[tuple[str, str, datetime]]:
+        now = utc_now()
+        due = (
+            select(Booking.id)
+            .where(Booking.status == BookingStatus.ACTIVE)
+            .where(Booking.reminder_sent_at.is_(None))
+            .where(Booking.start_time > now)
+            .where(Booking.start_time <= due_before)
+            .order_by(Booking.start_time)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        owner = select(User).where(User.id == Booking.user_id)
+        stmt = (
+            update(Booking)
+            .where(Booking.id.in_(due.scalar_subquery()))
+            .values(reminder_sent_at=now)
+            .returning(
+                owner.with_only_columns(User.email).scalar_subquery(),
+                owner.with_only_columns(User.full_name).scalar_subquery(),
+                Booking.start_time,
+            )
+        )
+        result = await self.session.execute(stmt)
+        return [(email, name, start) for email, name, start in result.all()]
+
+    @staticmethod
+    def _reminder_sent_at(
+        start_time: datetime, reminder_cutoff: datetime
+    ) -> datetime | None:
+        # Bookings that already start inside the reminder window get no reminder.
+        if start_time <= reminder_cutoff:
+            return utc_now()
+        return None
+
+    async def _raise_integrity_error(self, exc: IntegrityError) -> NoReturn:
+        await self.session.rollback()
+        sqlstate = get_sqlstate(exc)
+        if sqlstate == EXCLUSION_VIOLATION:
+            raise BusinessError("Table is not available for the selected time") from exc
+        if sqlstate == FOREIGN_KEY_VIOLATION:
+            raise NotFoundError("Table not found") from exc
+        raise exc
@@ -1,17 +1,52 @@
-from fastapi import APIRouter, Depends, Response, status
+from datetime import date
+
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.auth.dependencies import get_current_user
-from src.auth.models import User
+from src.auth.dependencies import get_current_admin, get_current_user
+from src.auth.schemas import CurrentUser
+from src.bookings.models import BookingStatus
 from src.bookings.repositories import BookingRepository
-from src.bookings.schemas import BookingCreate, BookingRead, BookingUpdate
+from src.bookings.schemas import (
+    BookingAutoCreate,
+    BookingBatchCreate,
+    BookingCreate,
+    BookingRead,
+    BookingScope,
+    BookingUpdate,
+    ExportFormat,
+)
 from src.bookings.services import BookingService
+from src.core.idempotency import IdempotencyStore, request_fingerprint
 from src.core.logging_decorators import log_endpoint
+from src.core.redis import redis_client
 from src.db.session import get_session
+from src.tables.cache import get_availability_cache
 from src.tables.repositories import TableRepository
 
 router = APIRouter(prefix="/bookings", tags=["bookings"])
 
+booking_adapter = TypeAdapter(BookingRead)
+booking_list_adapter = TypeAdapter(list[BookingRead])
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def get_idempotency_key(
+    idempotency_key: str | None = Header(
+        default=None,
+        alias="Idempotency-Key",
+        max_length=255,
+        description="Client-generated key; retries with the same key are replayed.",
+    ),
+) -> str | None:
+    return idempotency_key
+
 
 @router.post(
     "/",
@@ -23,29 +58,154 @@ router = APIRouter(prefix="/bookings", tags=["bookings"])
 @log_endpoint
 async def create_booking(
     payload: BookingCreate,
-    current_user: User = Depends(get_current_user),
+    idempotency_key: str | None = Depends(get_idempotency_key),
+    current_user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> BookingRead:
-    service = BookingService(BookingRepository(session), TableRepository(session))
-    booking = await service.create_booking(
-        current_user.id, payload.table_id, payload.date, payload.time
+    service = BookingService(
+        BookingRepository(session),
+        TableRepository(session),
+        get_availability_cache(),
+    )
+
+    async def handler() -> BookingRead:
+        booking = await service.create_booking(
+            current_user.id, payload.table_id, payload.date, payload.time
+        )
+        return BookingRead.model_validate(booking)
+
+    return await IdempotencyStore(redis_client).run(
+        idempotency_key,
+        f"{current_user.id}:create_booking",
+        request_fingerprint(payload.model_dump(mode="json")),
+        handler,
+        booking_adapter,
+    )
+
+
+@router.post(
+    "/auto",
+    response_model=BookingRead,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create a booking on the best-fitting table",
+    description=(
+        "Books the smallest free table that seats the party for a 2-hour "
+        "slot at the requested date and time."
+    ),
+)
+@log_endpoint
+async def create_best_fit_booking(
+    payload: BookingAutoCreate,
+    idempotency_key: str | None = Depends(get_idempotency_key),
+    current_user: CurrentUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> BookingRead:
+    service = BookingService(
+        BookingRepository(session),
+        TableRepository(session),
+        get_availability_cache(),
+    )
+
+    async def handler() -> BookingRead:
+        booking = await service.create_best_fit_booking(
+            current_user.id, payload.seats, payload.date, payload.time
+        )
+        return BookingRead.model_validate(booking)
+
+    return await IdempotencyStore(redis_client).run(
+        idempotency_key,
+        f"{current_user.id}:create_best_fit_booking",
+        request_fingerprint(payload.model_dump(mode="json")),
+        handler,
+        booking_adapter,
+    )
+
+
+@router.post(
+    "/batch",
+    response_model=list[BookingRead],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create several bookings",
+    description=(
+        "Creates 2-hour bookings for several tables in one transaction. "
+        "Either all bookings are created or none."
+    ),
+)
+@log_endpoint
+async def create_bookings(
+    payload: BookingBatchCreate,
+    idempotency_key: str | None = Depends(get_idempotency_key),
+    current_user: CurrentUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> list[BookingRead]:
+    service = BookingService(
+        BookingRepository(session),
+        TableRepository(session),
+        get_availability_cache(),
+    )
+
+    async def handler() -> list[BookingRead]:
+        bookings = await service.create_bookings(
+            current_user.id,
+            [(item.table_id, item.date, item.time) for item in payload.items],
+        )
+        return [BookingRead.model_validate(booking) for booking in bookings]
+
+    return await IdempotencyStore(redis_client).run(
+        idempotency_key,
+        f"{current_user.id}:create_bookings",
+        request_fingerprint(payload.model_dump(mode="json")),
+        handler,
+        booking_list_adapter,
     )
-    return BookingRead.model_validate(booking)
 
 
 @router.get(
     "/my",
     response_model=list[BookingRead],
     summary="Get my bookings",
-    description="Returns upcoming active bookings for the current user.",
+    description=(
+        "Returns the current user's bookings one page at a time. Upcoming "
+        "bookings are ordered by start time, past and all bookings newest "
+        "first. When more bookings exist, the X-Next-Cursor response header "
+        "holds the cursor for the next page."
+    ),
 )
 @log_endpoint
 async def list_my_bookings(
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    scope: BookingScope = Query(
+        default=BookingScope.UPCOMING,
+        description="Which bookings to return by start time.",
+    ),
+    booking_status: list[BookingStatus] = Query(
+        default=[BookingStatus.ACTIVE],
+        alias="status",
+        description="Booking statuses to include.",
+    ),
+    limit: int = Query(
+        default=20,
+        ge=1,
+        le=100,
+        description="Maximum number of bookings per page.",
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description="Cursor from the previous page's X-Next-Cursor header.",
+    ),
+    current_user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> list[BookingRead]:
-    service = BookingService(BookingRepository(session), TableRepository(session))
-    bookings = await service.list_my_bookings(current_user.id)
+    service = BookingService(
+        BookingRepository(session),
+        TableRepository(session),
+        get_availability_cache(),
+    )
+    bookings, next_cursor = await service.list_my_bookings(
+        current_user.id, scope, booking_status, limit, cursor
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return [BookingRead.model_validate(booking) for booking in bookings]
 
 
@@ -59,14 +219,29 @@ async def list_my_bookings(
 async def update_booking_time(
     booking_id: int,
     payload: BookingUpdate,
-    current_user: User = Depends(get_current_user),
+    idempotency_key: str | None = Depends(get_idempotency_key),
+    current_user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> BookingRead:
-    service = BookingService(BookingRepository(session), TableRepository(session))
-    booking = await service.update_booking_time(
-        booking_id, current_user.id, payload.date, payload.time
+    service = BookingService(
+        BookingRepository(session),
+        TableRepository(session),
+        get_availability_cache(),
+    )
+
+    async def handler() -> BookingRead:
+        booking = await service.update_booking_time(
+            booking_id, current_user.id, payload.date, payload.time
+        )
+        return BookingRead.model_validate(booking)
+
+    return await IdempotencyStore(redis_client).run(
+        idempotency_key,
+        f"{current_user.id}:update_booking_time:{booking_id}",
+        request_fingerprint(payload.model_dump(mode="json")),
+        handler,
+        booking_adapter,
     )
-    return BookingRead.model_validate(booking)
 
 
 @router.delete(
@@ -78,9 +253,57 @@ async def update_booking_time(
 @log_endpoint
 async def cancel_booking(
     booking_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> Response:
-    service = BookingService(BookingRepository(session), TableRepository(session))
+    service = BookingService(
+        BookingRepository(session),
+        TableRepository(session),
+        get_availability_cache(),
+    )
     await service.cancel_booking(booking_id, current_user.id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export bookings (admin)",
+    description=(
+        "Streams all bookings ordered by start time as NDJSON or CSV. "
+        "Admin access required."
+    ),
+)
+@log_endpoint
+async def export_bookings(
+    export_format: ExportFormat = Query(
+        default=ExportFormat.NDJSON,
+        alias="format",
+        description="Output format.",
+    ),
+    booking_status: list[BookingStatus] = Query(
+        default=[BookingStatus.ACTIVE, BookingStatus.CANCELED],
+        alias="status",
+        description="Booking statuses to include.",
+    ),
+    date_from: date | None = Query(
+        default=None,
+        description="First booking date to include, YYYY-MM-DD.",
+    ),
+    date_to: date | None = Query(
+        default=None,
+        description="Last booking date to include, YYYY-MM-DD.",
+    ),
+    _current_admin: CurrentUser = Depends(get_current_admin),
+    session: AsyncSession = Depends(get_session),
+) -> StreamingResponse:
+    service = BookingService(BookingRepository(session), TableRepository(session))
+    return StreamingResponse(
+        service.export_bookings(export_format, booking_status, date_from, date_to),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="bookings.{export_format.value}"'
+            )
+        },
+    )
@@ -1,5 +1,6 @@
 from datetime import date, datetime
 from datetime import time as time_type
+from enum import StrEnum
 from typing import Annotated
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -7,12 +8,33 @@ from pydantic import BaseModel, ConfigDict, Field
 from src.bookings.models import BookingStatus
 
 
+class BookingScope(StrEnum):
+    UPCOMING = "upcoming"
+    PAST = "past"
+    ALL = "all"
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
 class BookingCreate(BaseModel):
     table_id: Annotated[int, Field(examples=[1])]
     date: Annotated[date, Field(examples=["2026-02-07"])]
     time: Annotated[time_type, Field(examples=["19:30"])]
 
 
+class BookingAutoCreate(BaseModel):
+    seats: Annotated[int, Field(ge=1, examples=[4])]
+    date: Annotated[date, Field(examples=["2026-02-07"])]
+    time: Annotated[time_type, Field(examples=["19:30"])]
+
+
+class BookingBatchCreate(BaseModel):
+    items: Annotated[list[BookingCreate], Field(min_length=1, max_length=50)]
+
+
 class BookingUpdate(BaseModel):
     date: Annotated[date, Field(examples=["2026-02-07"])]
     time: Annotated[time_type, Field(examples=["20:00"])]
@@ -1,31 +1,120 @@
+import csv
+import hashlib
+import hmac
+import io
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import AsyncIterator
 from datetime import date, datetime, time, timedelta
 
-from src.bookings.models import Booking
+from src.bookings.models import Booking, BookingStatus
 from src.bookings.repositories import BookingRepository
+from src.bookings.schemas import BookingScope, ExportFormat
 from src.core.config import settings
 from src.core.errors import BusinessError, ForbiddenError, NotFoundError
 from src.core.logging_decorators import log_service
-from src.core.time_utils import (
-    combine_local,
-    is_past,
-    is_valid_slot_time,
-    is_within_horizon,
-    normalize_time,
-    to_utc,
-    utc_now,
-)
+from src.core.slots import SlotCalendar, slot_calendar
+from src.core.time_utils import to_utc, utc_now
+from src.tables.cache import AvailabilityCache
 from src.tables.repositories import TableRepository
-from src.tasks.tasks import send_booking_reminder
+
+CANCEL_CUTOFF = timedelta(hours=1)
+EXPORT_COLUMNS = (
+    "id",
+    "user_id",
+    "table_id",
+    "start_time",
+    "end_time",
+    "status",
+    "created_at",
+)
 
 
 class BookingService:
-    def __init__(self, bookings: BookingRepository, tables: TableRepository) -> None:
+    def __init__(
+        self,
+        bookings: BookingRepository,
+        tables: TableRepository,
+        availability_cache: AvailabilityCache | None = None,
+        calendar: SlotCalendar = slot_calendar,
+    ) -> None:
         self.bookings = bookings
         self.tables = tables
+        self.availability_cache = availability_cache
+        self.calendar = calendar
 
     @log_service
-    async def list_my_bookings(self, user_id: int) -> list[Booking]:
-        return await self.bookings.list_future_for_user(user_id)
+    async def list_my_bookings(
+        self,
+        user_id: int,
+        scope: BookingScope = BookingScope.UPCOMING,
+        statuses: list[BookingStatus] | None = None,
+        limit: int = 20,
+        cursor: str | None = None,
+    ) -> tuple[list[Booking], str | None]:
+        now = utc_now()
+        statuses = statuses or [BookingStatus.ACTIVE]
+        # Cursors are signed with the listing they came from, so one cannot
+        # be replayed against another user's or another filter's listing.
+        listing = f"{user_id}|{scope.value}|{','.join(sorted(statuses))}"
+        bookings = await self.bookings.list_for_user(
+            user_id,
+            statuses,
+            limit + 1,
+            starts_from=now if scope == BookingScope.UPCOMING else None,
+            starts_before=now if scope == BookingScope.PAST else None,
+            after=self._decode_cursor(cursor, listing) if cursor else None,
+            descending=scope != BookingScope.UPCOMING,
+        )
+        if len(bookings) <= limit:
+            return bookings, None
+        bookings = bookings[:limit]
+        return bookings, self._encode_cursor(bookings[-1], listing)
+
+    async def export_bookings(
+        self,
+        export_format: ExportFormat,
+        statuses: list[BookingStatus],
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> AsyncIterator[str]:
+        starts_from = starts_before = None
+        if date_from is not None:
+            starts_from = to_utc(
+                datetime.combine(date_from, time.min, self.calendar.timezone)
+            )
+        if date_to is not None:
+            starts_before = to_utc(
+                datetime.combine(
+                    date_to + timedelta(days=1), time.min, self.calendar.timezone
+                )
+            )
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if export_format == ExportFormat.CSV:
+            writer.writerow(EXPORT_COLUMNS)
+            yield self._drain(buffer)
+
+        async for rows in self.bookings.stream_export(
+            statuses, starts_from, starts_before, settings.booking_export_batch_size
+        ):
+            for row in rows:
+                values = [
+                    row.id,
+                    row.user_id,
+                    row.table_id,
+                    to_utc(row.start_time).isoformat(),
+                    to_utc(row.end_time).isoformat(),
+                    row.status.value,
+                    to_utc(row.created_at).isoformat(),
+                ]
+                if export_format == ExportFormat.CSV:
+                    writer.writerow(values)
+                else:
+                    buffer.write(json.dumps(dict(zip(EXPORT_COLUMNS, values))))
+                    buffer.write("\n")
+            yield self._drain(buffer)
 
     @log_service
     async def create_booking(
@@ -35,18 +124,79 @@ class BookingService:
         target_date: date,
         target_time: time,
     ) -> Booking:
-        local_start, local_end = self._build_slot(target_date, target_time)
-        start_time = to_utc(local_start)
-        end_time = to_utc(local_end)
-        await self._ensure_table_exists(table_id)
-        await self._ensure_slot_available(table_id, start_time, end_time)
-        booking_id = await self.bookings.create(user_id, table_id, start_time, end_time)
-        booking = await self.bookings.get_by_id(booking_id)
-        if not booking:
-            raise NotFoundError("Booking not found")
-        self._schedule_reminder(booking)
+        start_time, end_time = self.calendar.build_slot(target_date, target_time)
+        booking = await self.bookings.create(
+            user_id, table_id, start_time, end_time, self._reminder_cutoff()
+        )
+        await self._invalidate_availability(booking)
         return booking
 
+    @log_service
+    async def create_best_fit_booking(
+        self,
+        user_id: int,
+        seats: int,
+        target_date: date,
+        target_time: time,
+    ) -> Booking:
+        start_time, end_time = self.calendar.build_slot(target_date, target_time)
+        candidates = await self.tables.get_available(
+            start_time, end_time, seats, best_fit=True
+        )
+        for table in candidates:
+            try:
+                booking = await self.bookings.create(
+                    user_id, table.id, start_time, end_time, self._reminder_cutoff()
+                )
+            except BusinessError:
+                # Taken by a concurrent request since the lookup; try the next one.
+                continue
+            await self._invalidate_availability(booking)
+            return booking
+        raise BusinessError("No table is available for the selected time")
+
+    @log_service
+    async def create_bookings(
+        self,
+        user_id: int,
+        items: list[tuple[int, date, time]],
+    ) -> list[Booking]:
+        slots: list[tuple[int, datetime, datetime]] = []
+        for table_id, target_date, target_time in items:
+            start_time, end_time = self.calendar.build_slot(target_date, target_time)
+            slots.append((table_id, start_time, end_time))
+
+        bookable = await self.tables.get_bookable_ids(
+            {table_id for table_id, _, _ in slots}
+        )
+        missing = [
+            str(position)
+            for position, (table_id, _, _) in enumerate(slots, 1)
+            if table_id not in bookable
+        ]
+        if missing:
+            raise NotFoundError(f"Table not found (items: {', '.join(missing)})")
+
+        busy = await self.bookings.list_conflicts(slots)
+        unavailable = [
+            str(position)
+            for position, (table_id, start_time, end_time) in enumerate(slots, 1)
+            if self._overlaps(busy, table_id, start_time, end_time)
+            or self._overlaps(slots[: position - 1], table_id, start_time, end_time)
+        ]
+        if unavailable:
+            raise BusinessError(
+                "Table is not available for the selected time "
+                f"(items: {', '.join(unavailable)})"
+            )
+
+        bookings = await self.bookings.create_many(
+            user_id, slots, self._reminder_cutoff()
+        )
+        for booking in bookings:
+            await self._invalidate_availability(booking)
+        return bookings
+
     @log_service
     async def update_booking_time(
         self,
@@ -55,106 +205,106 @@ class BookingService:
         target_date: date,
         target_time: time,
     ) -> Booking:
-        booking = await self.bookings.get_by_id(booking_id)
-        if not booking:
-            raise NotFoundError("Booking not found")
-        if booking.user_id != user_id:
-            raise ForbiddenError("You cannot modify this booking")
-        local_start, local_end = self._build_slot(target_date, target_time)
-        start_time = to_utc(local_start)
-        end_time = to_utc(local_end)
-        await self._ensure_slot_available(
-            booking.table_id, start_time, end_time, booking.id
+        start_time, end_time = self.calendar.build_slot(target_date, target_time)
+        updated = await self.bookings.update_time(
+            booking_id, user_id, start_time, end_time, self._reminder_cutoff()
         )
-        booking = await self.bookings.update_time(booking, start_time, end_time)
-        self._schedule_reminder(booking)
+        if not updated:
+            await self._get_owned_booking(
+                booking_id, user_id, "You cannot modify this booking"
+            )
+            raise NotFoundError("Booking not found")
+        booking, previous_start, previous_end = updated
+        if self.availability_cache:
+            await self.availability_cache.invalidate(previous_start, previous_end)
+        await self._invalidate_availability(booking)
         return booking
 
     @log_service
     async def cancel_booking(self, booking_id: int, user_id: int) -> Booking:
-        booking = await self.bookings.get_by_id(booking_id)
+        booking = await self.bookings.cancel(
+            booking_id, user_id, utc_now() + CANCEL_CUTOFF
+        )
         if not booking:
+            existing = await self._get_owned_booking(
+                booking_id, user_id, "You cannot cancel this booking"
+            )
+            self._ensure_cancel_allowed(to_utc(existing.start_time))
             raise NotFoundError("Booking not found")
-        if booking.user_id != user_id:
-            raise ForbiddenError("You cannot cancel this booking")
-        self._ensure_cancel_allowed(booking.start_time)
-        return await self.bookings.cancel(booking)
+        await self._invalidate_availability(booking)
+        return booking
+
+    async def _invalidate_availability(self, booking: Booking) -> None:
+        if self.availability_cache:
+            await self.availability_cache.invalidate(
+                booking.start_time, booking.end_time
+            )
 
     @staticmethod
-    def _schedule_reminder(booking: Booking) -> None:
-        now = utc_now()
-        reminder_time = booking.start_time - timedelta(days=1)
-        if reminder_time <= now:
-            return
-        send_booking_reminder.apply_async(
-            args=[
-                booking.user.email,
-                booking.user.full_name,
-                booking.start_time.isoformat(),
-            ],
-            eta=reminder_time,
-        )
+    def _drain(buffer: io.StringIO) -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
 
-    async def _ensure_table_exists(self, table_id: int) -> None:
-        table = await self.tables.get_by_id(table_id)
-        if not table:
-            raise NotFoundError("Table not found")
+    @staticmethod
+    def _reminder_cutoff() -> datetime:
+        return utc_now() + timedelta(minutes=settings.booking_reminder_lead_minutes)
 
-    async def _ensure_slot_available(
-        self,
-        table_id: int,
-        start_time: datetime,
-        end_time: datetime,
-        exclude_booking_id: int | None = None,
-    ) -> None:
-        has_conflict = await self.bookings.has_conflict(
-            table_id, start_time, end_time, exclude_booking_id
-        )
-        if has_conflict:
-            raise BusinessError("Table is not available for the selected time")
+    @staticmethod
+    def _encode_cursor(booking: Booking, listing: str) -> str:
+        raw = f"{booking.start_time.isoformat()}|{booking.id}"
+        signature = BookingService._sign_cursor(raw, listing)
+        return urlsafe_b64encode(f"{raw}|{signature}".encode()).decode()
 
     @staticmethod
-    def _ensure_within_working_hours(start_time: datetime, end_time: datetime) -> None:
-        open_time = time.fromisoformat(settings.booking_open_time)
-        close_time = time.fromisoformat(settings.booking_close_time)
+    def _decode_cursor(cursor: str, listing: str) -> tuple[datetime, int]:
+        try:
+            raw, signature = urlsafe_b64decode(cursor).decode().rsplit("|", 1)
+            start_time, booking_id = raw.split("|")
+            after = datetime.fromisoformat(start_time), int(booking_id)
+        except ValueError as exc:
+            raise BusinessError("Invalid cursor") from exc
+        if not hmac.compare_digest(
+            signature, BookingService._sign_cursor(raw, listing)
+        ):
+            raise BusinessError("Invalid cursor")
+        return after
 
-        if start_time.time() < open_time or end_time.time() > close_time:
-            raise BusinessError("Requested time is outside of working hours")
+    @staticmethod
+    def _sign_cursor(raw: str, listing: str) -> str:
+        return hmac.new(
+            settings.jwt_secret.encode(), f"{listing}|{raw}".encode(), hashlib.sha256
+        ).hexdigest()
 
     @staticmethod
-    def _ensure_same_day(start_time: datetime, end_time: datetime) -> None:
-        if end_time.date() != start_time.date():
-            raise BusinessError("Requested time is outside of working hours")
+    def _overlaps(
+        intervals: list[tuple[int, datetime, datetime]],
+        table_id: int,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> bool:
+        return any(
+            busy_table_id == table_id
+            and to_utc(busy_start) < end_time
+            and to_utc(busy_end) > start_time
+            for busy_table_id, busy_start, busy_end in intervals
+        )
+
+    async def _get_owned_booking(
+        self, booking_id: int, user_id: int, message: str
+    ) -> Booking:
+        booking = await self.bookings.get_by_id(booking_id)
+        if not booking:
+            raise NotFoundError("Booking not found")
+        if booking.user_id != user_id:
+            raise ForbiddenError(message)
+        return booking
 
     @staticmethod
     def _ensure_cancel_allowed(start_time: datetime) -> None:
         now = utc_now()
-        if start_time - now < timedelta(hours=1):
+        if start_time - now < CANCEL_CUTOFF:
             raise BusinessError(
                 "Booking cannot be canceled less than 1 hour before start"
             )
-
-    @staticmethod
-    def _ensure_booking_window(start_time: datetime) -> None:
-        if is_past(start_time):
-            raise BusinessError("Booking time cannot be in the past")
-        if not is_within_horizon(start_time, settings.booking_max_days_ahead):
-            raise BusinessError("Booking date is too far in the future")
-        if not is_valid_slot_time(start_time, settings.booking_slot_minutes):
-            raise BusinessError("Booking time must align to the slot minutes")
-
-    @staticmethod
-    def _normalize_time(target_time: time) -> time:
-        return normalize_time(target_time)
-
-    @classmethod
-    def _build_slot(cls, target_date: date, target_time: time) -> tuple[datetime, datetime]:
-        normalized_time = cls._normalize_time(target_time)
-        local_start = combine_local(target_date, normalized_time)
-        local_end = local_start + timedelta(
-            minutes=settings.booking_duration_minutes
-        )
-        cls._ensure_within_working_hours(local_start, local_end)
-        cls._ensure_same_day(local_start, local_end)
-        cls._ensure_booking_window(local_start)
-        return local_start, local_end
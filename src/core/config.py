@@ -1,3 +1,5 @@
+from datetime import date
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,6 +13,14 @@ class Settings(BaseSettings):
     booking_duration_minutes: int = 120
     booking_open_time: str = "12:00"
     booking_close_time: str = "22:00"
+    booking_weekday_hours: dict[str, str] = {}
+    booking_closed_dates: list[date] = []
+    booking_index_enabled: bool = False
+    booking_reminder_lead_minutes: int = 1440
+    booking_reminder_sweep_seconds: int = 60
+    booking_reminder_batch_size: int = 500
+    booking_export_batch_size: int = 1000
+    booking_index_refresh_seconds: int = 300
     database_url: str = ""
     postgres_host: str = "localhost"
     postgres_port: int = 5432
@@ -19,14 +29,37 @@ class Settings(BaseSettings):
     postgres_password: str = "tablereservations"
     jwt_secret: str = ""
     jwt_algorithm: str = "HS256"
-    jwt_expires_minutes: int = 60
+    jwt_expires_minutes: int = 15
+    jwt_refresh_expires_days: int = 14
+    password_hash_workers: int = 4
+    password_bcrypt_rounds: int = 12
+    password_calibrate_on_startup: bool = False
+    password_target_verify_ms: int = 250
+    auth_throttle_enabled: bool = True
+    auth_throttle_ip_capacity: int = 20
+    auth_throttle_ip_refill_per_minute: int = 10
+    auth_throttle_email_capacity: int = 5
+    auth_throttle_email_refill_per_minute: int = 2
+    auth_backoff_after_failures: int = 3
+    auth_backoff_base_seconds: int = 2
+    auth_backoff_max_seconds: int = 900
+    auth_user_cache_size: int = 10000
+    auth_user_cache_ttl_seconds: int = 30
+    auth_user_cache_redis_enabled: bool = False
     redis_url: str = "redis://localhost:6379/0"
+    idempotency_ttl_seconds: int = 86400
+    availability_cache_enabled: bool = True
+    availability_cache_ttl_seconds: int = 30
+    table_catalogue_cache_enabled: bool = True
+    table_catalogue_recheck_seconds: float = 1.0
+    idempotency_lock_seconds: int = 30
     log_level: str = "INFO"
     log_dir: str = "logs"
     log_file: str = "app.log"
     log_rotation_when: str = "midnight"
     log_backup_count: int = 7
     log_color: bool = True
+    log_console_json: bool = False
     smtp_host: str = "localhost"
     smtp_port: int = 1025
     smtp_user: str = ""
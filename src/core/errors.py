@@ -16,3 +16,17 @@ class ForbiddenError(AppError):
 
 class UnauthorizedError(AppError):
     pass
+
+
+class ConflictError(AppError):
+    pass
+
+
+class ServiceUnavailableError(AppError):
+    pass
+
+
+class TooManyRequestsError(AppError):
+    def __init__(self, message: str, retry_after: int) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
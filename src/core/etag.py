@@ -0,0 +1,20 @@
+import hashlib
+
+from pydantic import BaseModel
+
+
+def make_etag(*models: BaseModel) -> str:
+    digest = hashlib.sha256()
+    for model in models:
+        digest.update(model.model_dump_json().encode())
+        digest.update(b"\n")
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {value.strip() for value in if_none_match.split(",")}
+    if "*" in candidates:
+        return True
+    return etag in {value.removeprefix("W/") for value in candidates}
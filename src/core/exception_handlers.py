@@ -3,8 +3,11 @@ from fastapi.responses import JSONResponse
 
 from src.core.errors import (
     BusinessError,
+    ConflictError,
     ForbiddenError,
     NotFoundError,
+    ServiceUnavailableError,
+    TooManyRequestsError,
     UnauthorizedError,
 )
 
@@ -13,6 +16,12 @@ def create_json_error(status_code: int, exc: Exception) -> JSONResponse:
     return JSONResponse(status_code=status_code, content={"detail": str(exc)})
 
 
+def create_throttled_error(exc: TooManyRequestsError) -> JSONResponse:
+    response = create_json_error(429, exc)
+    response.headers["Retry-After"] = str(exc.retry_after)
+    return response
+
+
 def add_exception_handlers(app: FastAPI) -> None:
     app.add_exception_handler(
         BusinessError, lambda _request, exc: create_json_error(400, exc)
@@ -26,3 +35,12 @@ def add_exception_handlers(app: FastAPI) -> None:
     app.add_exception_handler(
         UnauthorizedError, lambda _request, exc: create_json_error(401, exc)
     )
+    app.add_exception_handler(
+        ConflictError, lambda _request, exc: create_json_error(409, exc)
+    )
+    app.add_exception_handler(
+        ServiceUnavailableError, lambda _request, exc: create_json_error(503, exc)
+    )
+    app.add_exception_handler(
+        TooManyRequestsError, lambda _request, exc: create_throttled_error(exc)
+    )
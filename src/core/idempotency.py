@@ -0,0 +1,130 @@
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.core.config import settings
+from src.core.errors import BusinessError, ConflictError
+
+T = TypeVar("T")
+
+logger = logging.getLogger("app.idempotency")
+
+PENDING = "pending"
+DONE = "done"
+POLL_INTERVAL_SECONDS = 0.1
+
+# KEYS: idempotency key. ARGV: this request's pending marker.
+# Deletes the key only while it still holds that marker, so a request whose
+# lease expired cannot release a key another request has claimed since.
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def request_fingerprint(*parts: Any) -> str:
+    raw = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class IdempotencyStore:
+    """Replays stored responses for repeated ``Idempotency-Key`` requests.
+
+    The first request claims the key with a short-lived pending marker;
+    duplicates wait for it to finish and get the stored response instead of
+    running the handler again. Failed requests release the key so that the
+    client can retry. Redis errors fall back to running the handler.
+    """
+
+    def __init__(self, redis: Redis) -> None:
+        self.redis = redis
+        self._release_script = redis.register_script(RELEASE_SCRIPT)
+
+    async def run(
+        self,
+        key: str | None,
+        scope: str,
+        fingerprint: str,
+        handler: Callable[[], Awaitable[T]],
+        adapter: TypeAdapter[T],
+    ) -> T:
+        if not key:
+            return await handler()
+        redis_key = f"idempotency:{scope}:{key}"
+        pending = json.dumps(
+            {"state": PENDING, "fingerprint": fingerprint, "token": uuid4().hex}
+        )
+        try:
+            cached = await self._claim_or_wait(redis_key, fingerprint, pending)
+        except RedisError:
+            logger.warning(
+                "Idempotency store unavailable",
+                extra={"event": "idempotency_unavailable"},
+            )
+            return await handler()
+        if cached is not None:
+            return adapter.validate_python(cached)
+
+        try:
+            result = await handler()
+        except Exception:
+            await self._release(redis_key, pending)
+            raise
+        await self._store(
+            redis_key, fingerprint, adapter.dump_python(result, mode="json")
+        )
+        return result
+
+    async def _claim_or_wait(
+        self, redis_key: str, fingerprint: str, pending: str
+    ) -> Any | None:
+        deadline = asyncio.get_running_loop().time() + settings.idempotency_lock_seconds
+        while True:
+            claimed = await self.redis.set(
+                redis_key, pending, nx=True, ex=settings.idempotency_lock_seconds
+            )
+            if claimed:
+                return None
+            raw = await self.redis.get(redis_key)
+            if raw is not None:
+                entry = json.loads(raw)
+                if entry["fingerprint"] != fingerprint:
+                    raise BusinessError(
+                        "Idempotency-Key was already used for a different request"
+                    )
+                if entry["state"] == DONE:
+                    return entry["body"]
+            if asyncio.get_running_loop().time() >= deadline:
+                raise ConflictError(
+                    "A request with this Idempotency-Key is still in progress"
+                )
+            await asyncio.sleep(POLL_INTERVAL_SECONDS)
+
+    async def _store(self, redis_key: str, fingerprint: str, body: Any) -> None:
+        entry = json.dumps({"state": DONE, "fingerprint": fingerprint, "body": body})
+        try:
+            await self.redis.set(redis_key, entry, ex=settings.idempotency_ttl_seconds)
+        except RedisError:
+            logger.warning(
+                "Failed to store idempotent response",
+                extra={"event": "idempotency_unavailable"},
+            )
+
+    async def _release(self, redis_key: str, pending: str) -> None:
+        try:
+            await self._release_script(keys=[redis_key], args=[pending])
+        except RedisError:
+            logger.warning(
+                "Failed to release idempotency key",
+                extra={"event": "idempotency_unavailable"},
+            )
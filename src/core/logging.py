@@ -1,9 +1,20 @@
+import atexit
+import copy
+import json
 import logging
 import os
-from logging.handlers import TimedRotatingFileHandler
+import queue
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 
 from src.core.config import settings
 
+# Attributes every LogRecord has; anything else came in through ``extra``.
+RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_listener: QueueListener | None = None
+_exception_formatter = logging.Formatter()
+
 
 class TextFormatter(logging.Formatter):
     COLORS = {
@@ -30,7 +41,55 @@ class TextFormatter(logging.Formatter):
         return formatted
 
 
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, including the fields passed via ``extra``."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(
+            (key, value)
+            for key, value in vars(record).items()
+            if key not in RECORD_ATTRS
+        )
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class LogQueueHandler(QueueHandler):
+    """Queues records for the listener thread, which does the formatting and I/O.
+
+    Only the message and traceback are rendered here, so the record no longer
+    references request arguments or frames; ``extra`` fields are kept as is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or _exception_formatter.formatException(
+                record.exc_info
+            )
+            record.exc_info = None
+        return record
+
+
 def setup_logging() -> None:
+    global _listener
+    if _listener is not None:
+        return
     log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
     log_format = "[%(asctime)s] [%(levelname)s] %(name)s %(message)s"
 
@@ -39,7 +98,9 @@ def setup_logging() -> None:
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
     console_handler.setFormatter(
-        TextFormatter(log_format, use_color=settings.log_color)
+        JsonFormatter()
+        if settings.log_console_json
+        else TextFormatter(log_format, use_color=settings.log_color)
     )
     handlers.append(console_handler)
 
@@ -53,12 +114,18 @@ def setup_logging() -> None:
             encoding="utf-8",
         )
         file_handler.setLevel(log_level)
-        file_handler.setFormatter(TextFormatter(log_format, use_color=False))
+        file_handler.setFormatter(JsonFormatter())
         handlers.append(file_handler)
 
+    # Request handlers only enqueue records; a listener thread writes them.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
     logging.basicConfig(
         level=log_level,
-        handlers=handlers,
+        handlers=[LogQueueHandler(log_queue)],
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     logging.getLogger("passlib.handlers.bcrypt").setLevel(logging.ERROR)
@@ -0,0 +1,5 @@
+from redis.asyncio import Redis
+
+from src.core.config import settings
+
+redis_client: Redis = Redis.from_url(settings.redis_url, decode_responses=True)
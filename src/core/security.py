@@ -1,17 +1,102 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from typing import TypeVar
+from uuid import uuid4
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from prometheus_client import Histogram
+from pydantic import ValidationError
 
 from src.auth.schemas import TokenPayload
 from src.core.config import settings
 
+ACCESS_TOKEN = "access"
+REFRESH_TOKEN = "refresh"
+
 pwd_context = CryptContext(
     schemes=["bcrypt_sha256", "bcrypt"],
     deprecated=["bcrypt"],
 )
 
 
+# bcrypt releases the GIL, so a small thread pool keeps hashing off the event
+# loop; its size caps how many hashes a worker runs at once.
+password_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers,
+    thread_name_prefix="password",
+)
+
+password_queue_seconds = Histogram(
+    "password_hash_queue_seconds",
+    "Time password hashing work waits for a free thread.",
+    ["operation"],
+)
+
+T = TypeVar("T")
+
+
+def configure_password_rounds(rounds: int) -> None:
+    """Hash new passwords with ``rounds`` and flag cheaper hashes for rehash."""
+    pwd_context.update(
+        bcrypt_sha256__rounds=rounds,
+        bcrypt_sha256__min_desired_rounds=rounds,
+        # Never "upgrade" a hash to fewer rounds.
+        bcrypt_sha256__max_desired_rounds=31,
+    )
+
+
+configure_password_rounds(settings.password_bcrypt_rounds)
+
+
+def calibrate_password_rounds(
+    target_ms: float, min_rounds: int = 10, max_rounds: int = 16
+) -> int:
+    """Most bcrypt rounds whose verify still fits in ``target_ms`` on this CPU.
+
+    Each extra round doubles the cost, so one timing at ``min_rounds`` is
+    enough to extrapolate.
+    """
+    sample = pwd_context.handler().using(rounds=min_rounds).hash("calibration")
+    elapsed_ms = min(_time_verify(sample) for _ in range(3))
+    rounds = min_rounds
+    while rounds < max_rounds and elapsed_ms * 2 <= target_ms:
+        rounds += 1
+        elapsed_ms *= 2
+    return rounds
+
+
+def benchmark_password_verify(rounds: int, workers: int, seconds: float = 3) -> float:
+    """Verifies per second with ``workers`` threads, as in one API worker."""
+    sample = pwd_context.handler().using(rounds=rounds).hash("benchmark")
+    deadline = time.monotonic() + seconds
+
+    def run() -> int:
+        count = 0
+        while time.monotonic() < deadline:
+            pwd_context.verify("benchmark", sample)
+            count += 1
+        return count
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        total = sum(executor.map(lambda _: run(), range(workers)))
+    return total / (time.monotonic() - started)
+
+
+def _time_verify(hashed_password: str) -> float:
+    started = time.perf_counter()
+    pwd_context.verify("calibration", hashed_password)
+    return (time.perf_counter() - started) * 1000
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    return pwd_context.needs_update(hashed_password)
+
+
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
@@ -20,19 +105,77 @@ def verify_password(password: str, hashed_password: str) -> bool:
     return pwd_context.verify(password, hashed_password)
 
 
-def create_access_token(subject: int) -> str:
-    expire = datetime.now(timezone.utc) + timedelta(
-        minutes=settings.jwt_expires_minutes
+async def hash_password_async(password: str) -> str:
+    return await _run_password_work("hash", hash_password, password)
+
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    return await _run_password_work(
+        "verify", verify_password, password, hashed_password
+    )
+
+
+async def _run_password_work(operation: str, func: Callable[..., T], *args: str) -> T:
+    queued_at = time.monotonic()
+
+    def run() -> T:
+        password_queue_seconds.labels(operation=operation).observe(
+            time.monotonic() - queued_at
+        )
+        return func(*args)
+
+    return await asyncio.get_running_loop().run_in_executor(password_executor, run)
+
+
+def create_access_token(
+    subject: int,
+    is_admin: bool | None = None,
+    version: int | None = None,
+) -> str:
+    """Issue an access token.
+
+    Tokens with ``is_admin`` and ``version`` are authorized from their claims;
+    tokens without them fall back to a user lookup.
+    """
+    claims: dict[str, object] = {"typ": ACCESS_TOKEN}
+    if is_admin is not None:
+        claims["adm"] = is_admin
+    if version is not None:
+        claims["ver"] = version
+    return _encode_token(
+        subject, timedelta(minutes=settings.jwt_expires_minutes), claims
+    )
+
+
+def create_refresh_token(subject: int, version: int) -> str:
+    return _encode_token(
+        subject,
+        timedelta(days=settings.jwt_refresh_expires_days),
+        {"typ": REFRESH_TOKEN, "ver": version},
     )
-    payload = {"sub": str(subject), "exp": expire}
-    return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
 
 
 def decode_access_token(token: str) -> TokenPayload:
+    return _decode_token(token, ACCESS_TOKEN)
+
+
+def decode_refresh_token(token: str) -> TokenPayload:
+    return _decode_token(token, REFRESH_TOKEN)
+
+
+def _encode_token(subject: int, lifetime: timedelta, claims: dict[str, object]) -> str:
+    expire = datetime.now(timezone.utc) + lifetime
+    payload = {"sub": str(subject), "exp": expire, "jti": uuid4().hex, **claims}
+    return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
+
+
+def _decode_token(token: str, token_type: str) -> TokenPayload:
     try:
-        payload = jwt.decode(
-            token, settings.jwt_secret, algorithms=[settings.jwt_algorithm]
+        payload = TokenPayload.model_validate(
+            jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
         )
-        return TokenPayload.model_validate(payload)
-    except JWTError as exc:
+    except (JWTError, ValidationError) as exc:
         raise ValueError("Invalid token") from exc
+    if payload.typ != token_type:
+        raise ValueError("Invalid token type")
+    return payload
@@ -0,0 +1,181 @@
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from src.core.config import Settings, settings
+from src.core.errors import BusinessError
+from src.core.time_utils import normalize_time, to_utc, utc_now
+
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+Hours = tuple[time, time]
+
+
+class SlotCalendar:
+    """Bookable slot starts in the application timezone.
+
+    Opening hours are parsed once. Each day's slot starts are built on first
+    use and kept in a dict keyed by wall-clock time, so validating or listing
+    a day's slots is a lookup. Slot ends are computed in UTC, so a slot that
+    spans a DST change still lasts exactly the booking duration; wall-clock
+    times skipped by a DST change are not bookable.
+    """
+
+    def __init__(
+        self,
+        timezone: ZoneInfo,
+        slot_minutes: int,
+        duration_minutes: int,
+        max_days_ahead: int,
+        weekly_hours: dict[int, Hours | None],
+        closed_dates: frozenset[date] = frozenset(),
+    ) -> None:
+        self.timezone = timezone
+        self.slot_minutes = slot_minutes
+        self.duration = timedelta(minutes=duration_minutes)
+        self.horizon = timedelta(days=max_days_ahead)
+        self.weekly_hours = weekly_hours
+        self.closed_dates = closed_dates
+        self._days: dict[date, dict[time, datetime]] = {}
+
+    @classmethod
+    def from_settings(cls, settings_obj: Settings) -> "SlotCalendar":
+        default = (
+            time.fromisoformat(settings_obj.booking_open_time),
+            time.fromisoformat(settings_obj.booking_close_time),
+        )
+        weekly_hours: dict[int, Hours | None] = dict.fromkeys(range(7), default)
+        for weekday, hours in settings_obj.booking_weekday_hours.items():
+            weekly_hours[WEEKDAYS.index(weekday.lower()[:3])] = _parse_hours(hours)
+        return cls(
+            ZoneInfo(settings_obj.app_timezone),
+            settings_obj.booking_slot_minutes,
+            settings_obj.booking_duration_minutes,
+            settings_obj.booking_max_days_ahead,
+            weekly_hours,
+            frozenset(settings_obj.booking_closed_dates),
+        )
+
+    def hours_for(self, target_date: date) -> Hours | None:
+        if target_date in self.closed_dates:
+            return None
+        return self.weekly_hours[target_date.weekday()]
+
+    def day_bounds(self, target_date: date) -> tuple[datetime, datetime] | None:
+        hours = self.hours_for(target_date)
+        if hours is None:
+            return None
+        open_time, close_time = hours
+        return (
+            to_utc(self._localize(target_date, open_time)),
+            to_utc(self._localize(target_date, close_time)),
+        )
+
+    def day_slots(self, target_date: date) -> list[datetime]:
+        """Every scheduled slot start of the day, including past ones."""
+        return list(self._day(target_date).values())
+
+    def open_slots(self, target_date: date) -> list[datetime]:
+        """Slot starts of the day that can still be booked."""
+        now = utc_now()
+        latest = now + self.horizon
+        return [
+            slot for slot in self._day(target_date).values() if now <= slot <= latest
+        ]
+
+    def horizon_dates(self) -> list[date]:
+        now = utc_now()
+        first_day = now.astimezone(self.timezone).date()
+        last_day = (now + self.horizon).astimezone(self.timezone).date()
+        return [
+            first_day + timedelta(days=offset)
+            for offset in range((last_day - first_day).days + 1)
+        ]
+
+    def build_slot(
+        self, target_date: date, target_time: time
+    ) -> tuple[datetime, datetime]:
+        """Validate a requested slot and return its UTC start and end."""
+        target_time = normalize_time(target_time)
+        hours = self.hours_for(target_date)
+        if hours is None:
+            raise BusinessError("Booking is not available on the selected date")
+
+        slot = self._day(target_date).get(target_time)
+        if slot is None:
+            requested = to_utc(self._localize(target_date, target_time))
+            if requested.astimezone(self.timezone).time() != target_time:
+                raise BusinessError("Requested time does not exist on this date")
+            open_time, close_time = hours
+            local_end = (requested + self.duration).astimezone(self.timezone)
+            if (
+                target_time < open_time
+                or local_end.date() != target_date
+                or local_end.time() > close_time
+            ):
+                raise BusinessError("Requested time is outside of working hours")
+            raise BusinessError("Booking time must align to the slot minutes")
+
+        start_time = to_utc(slot)
+        self.ensure_bookable(start_time)
+        return start_time, start_time + self.duration
+
+    def ensure_bookable(self, start_time: datetime) -> None:
+        now = utc_now()
+        if start_time < now:
+            raise BusinessError("Booking time cannot be in the past")
+        if start_time > now + self.horizon:
+            raise BusinessError("Booking date is too far in the future")
+
+    def _day(self, target_date: date) -> dict[time, datetime]:
+        slots = self._days.get(target_date)
+        if slots is None:
+            if len(self._days) > self.horizon.days + 7:
+                self._prune()
+            slots = self._days[target_date] = self._build_day(target_date)
+        return slots
+
+    def _build_day(self, target_date: date) -> dict[time, datetime]:
+        hours = self.hours_for(target_date)
+        if hours is None:
+            return {}
+        open_time, close_time = hours
+        day_close = to_utc(self._localize(target_date, close_time))
+
+        open_minute = (
+            open_time.hour * 60
+            + open_time.minute
+            + (1 if open_time.second or open_time.microsecond else 0)
+        )
+        first_minute = -(-open_minute // self.slot_minutes) * self.slot_minutes
+        slots: dict[time, datetime] = {}
+        for minute in range(first_minute, 24 * 60, self.slot_minutes):
+            wall_time = time(minute // 60, minute % 60)
+            slot = self._localize(target_date, wall_time)
+            start_time = to_utc(slot)
+            if start_time + self.duration > day_close:
+                break
+            if start_time.astimezone(self.timezone).time() != wall_time:
+                # Skipped by a DST transition.
+                continue
+            slots[wall_time] = slot
+        return slots
+
+    def _localize(self, target_date: date, target_time: time) -> datetime:
+        return datetime.combine(target_date, target_time, tzinfo=self.timezone)
+
+    def _prune(self) -> None:
+        today = utc_now().astimezone(self.timezone).date()
+        last_day = today + timedelta(days=self.horizon.days + 1)
+        stale = [day for day in self._days if day < today or day > last_day]
+        for cached_date in stale:
+            del self._days[cached_date]
+
+
+def _parse_hours(value: str) -> Hours | None:
+    if value.strip().lower() in {"", "closed"}:
+        return None
+    open_time, close_time = value.split("-")
+    return time.fromisoformat(open_time.strip()), time.fromisoformat(close_time.strip())
+
+
+slot_calendar = SlotCalendar.from_settings(settings)
@@ -0,0 +1,11 @@
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def dialect_insert(
+    session: AsyncSession, model: type
+) -> postgresql.Insert | sqlite.Insert:
+    """``INSERT`` with ``on_conflict_*`` support for the session's database."""
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite.insert(model)
+    return postgresql.insert(model)
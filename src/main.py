@@ -1,15 +1,29 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from prometheus_fastapi_instrumentator import Instrumentator
 
 from src.api import api_router
+from src.bookings.listeners import booking_index_listener
 from src.core.config import settings
 from src.core.exception_handlers import add_exception_handlers
 from src.core.logging import setup_logging
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    if settings.booking_index_enabled:
+        await booking_index_listener.start()
+    try:
+        yield
+    finally:
+        await booking_index_listener.stop()
+
+
 def create_app() -> FastAPI:
     setup_logging()
-    new_app = FastAPI(title=settings.app_name)
+    new_app = FastAPI(title=settings.app_name, lifespan=lifespan)
     add_exception_handlers(new_app)
     new_app.include_router(api_router)
     Instrumentator().instrument(new_app).expose(new_app, include_in_schema=False)
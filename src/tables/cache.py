@@ -0,0 +1,112 @@
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Any
+
+from prometheus_client import Counter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.core.config import settings
+from src.core.redis import redis_client
+from src.core.slots import SlotCalendar, slot_calendar
+from src.core.time_utils import to_utc
+
+KEY_PREFIX = "availability"
+
+logger = logging.getLogger("app.availability_cache")
+
+cache_requests = Counter(
+    "availability_cache_requests",
+    "Availability cache lookups by result.",
+    ["result"],
+)
+
+
+class AvailabilityCache:
+    """Caches ``/tables/available`` results in Redis, one hash per slot start.
+
+    Hash fields are the seat filters, so invalidating a slot drops every
+    filter at once. The hash expires ``availability_cache_ttl_seconds``
+    after its first write. Redis errors are treated as misses.
+    """
+
+    def __init__(self, redis: Redis, calendar: SlotCalendar = slot_calendar) -> None:
+        self.redis = redis
+        self.calendar = calendar
+
+    async def get(
+        self, start_time: datetime, seats: int | None
+    ) -> list[dict[str, Any]] | None:
+        try:
+            raw = await self.redis.hget(self._key(start_time), self._field(seats))
+        except RedisError:
+            self._log_unavailable()
+            raw = None
+        cache_requests.labels(result="miss" if raw is None else "hit").inc()
+        return None if raw is None else json.loads(raw)
+
+    async def set(
+        self,
+        start_time: datetime,
+        seats: int | None,
+        tables: list[dict[str, Any]],
+    ) -> None:
+        key = self._key(start_time)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hset(key, self._field(seats), json.dumps(tables))
+                pipe.expire(key, settings.availability_cache_ttl_seconds, nx=True)
+                await pipe.execute()
+        except RedisError:
+            self._log_unavailable()
+
+    async def invalidate(self, start_time: datetime, end_time: datetime) -> None:
+        # A cached slot [q, q + duration) is stale if it overlaps the booking.
+        # Slot starts come from the calendar, as in the endpoint, so they
+        # match even when local midnight is not aligned to the slot step.
+        start_time, end_time = to_utc(start_time), to_utc(end_time)
+        duration = self.calendar.duration
+        first_day = (start_time - duration).astimezone(self.calendar.timezone).date()
+        last_day = end_time.astimezone(self.calendar.timezone).date()
+        keys = [
+            self._key(slot)
+            for offset in range((last_day - first_day).days + 1)
+            for slot in self.calendar.day_slots(first_day + timedelta(days=offset))
+            if to_utc(slot) < end_time and to_utc(slot) + duration > start_time
+        ]
+        if not keys:
+            return
+        try:
+            await self.redis.delete(*keys)
+        except RedisError:
+            self._log_unavailable()
+
+    async def invalidate_all(self) -> None:
+        try:
+            keys = [key async for key in self.redis.scan_iter(f"{KEY_PREFIX}:*")]
+            if keys:
+                await self.redis.delete(*keys)
+        except RedisError:
+            self._log_unavailable()
+
+    @staticmethod
+    def _key(start_time: datetime) -> str:
+        return f"{KEY_PREFIX}:{to_utc(start_time).isoformat()}"
+
+    @staticmethod
+    def _field(seats: int | None) -> str:
+        return "any" if seats is None else str(seats)
+
+    @staticmethod
+    def _log_unavailable() -> None:
+        logger.warning(
+            "Availability cache unavailable",
+            extra={"event": "availability_cache_unavailable"},
+        )
+
+
+def get_availability_cache() -> AvailabilityCache | None:
+    if not settings.availability_cache_enabled:
+        return None
+    return AvailabilityCache(redis_client)
@@ -0,0 +1,104 @@
+import logging
+import time
+
+from prometheus_client import Counter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.core.config import settings
+from src.core.redis import redis_client
+from src.tables.repositories import TableRepository
+from src.tables.schemas import TableRead
+
+VERSION_KEY = "tables:version"
+
+logger = logging.getLogger("app.table_catalogue")
+
+catalogue_requests = Counter(
+    "table_catalogue_requests",
+    "Table catalogue lookups by result.",
+    ["result"],
+)
+
+
+class TableCatalogue:
+    """Per-worker snapshot of the table catalogue.
+
+    The snapshot is tagged with the ``tables:version`` counter from Redis and
+    reloaded whenever another worker bumps it. The version is read before
+    loading, so a write that lands mid-load only causes one extra reload.
+    After a check the version is trusted for ``recheck_seconds``, so other
+    workers' writes show up within that delay and hot paths skip the Redis
+    round trip; this worker's own writes are seen at once. Without Redis the
+    catalogue is read from the database every time.
+    """
+
+    def __init__(self, redis: Redis, recheck_seconds: float = 0) -> None:
+        self.redis = redis
+        self.recheck_seconds = recheck_seconds
+        self._version: int | None = None
+        self._checked_at = 0.0
+        self._tables: dict[int, TableRead] = {}
+
+    async def get_all(self, tables: TableRepository) -> list[TableRead]:
+        return list((await self._load(tables)).values())
+
+    async def get(self, tables: TableRepository, table_id: int) -> TableRead | None:
+        return (await self._load(tables)).get(table_id)
+
+    async def bump(self) -> None:
+        self._version = None
+        try:
+            await self.redis.incr(VERSION_KEY)
+        except RedisError:
+            self._log_unavailable()
+
+    def clear(self) -> None:
+        self._version = None
+        self._tables = {}
+
+    async def _load(self, tables: TableRepository) -> dict[int, TableRead]:
+        now = time.monotonic()
+        if self._version is not None and now - self._checked_at < self.recheck_seconds:
+            catalogue_requests.labels(result="hit").inc()
+            return self._tables
+
+        version = await self._current_version()
+        if version is not None and version == self._version:
+            self._checked_at = now
+            catalogue_requests.labels(result="hit").inc()
+            return self._tables
+
+        catalogue_requests.labels(result="miss").inc()
+        snapshot = {
+            table.id: TableRead.model_validate(table)
+            for table in await tables.get_all()
+        }
+        if version is not None:
+            self._version, self._tables = version, snapshot
+            self._checked_at = now
+        return snapshot
+
+    async def _current_version(self) -> int | None:
+        try:
+            raw = await self.redis.get(VERSION_KEY)
+        except RedisError:
+            self._log_unavailable()
+            return None
+        return int(raw or 0)
+
+    @staticmethod
+    def _log_unavailable() -> None:
+        logger.warning(
+            "Table catalogue version unavailable",
+            extra={"event": "table_catalogue_unavailable"},
+        )
+
+
+table_catalogue = TableCatalogue(redis_client, settings.table_catalogue_recheck_seconds)
+
+
+def get_table_catalogue() -> TableCatalogue | None:
+    if not settings.table_catalogue_cache_enabled:
+        return None
+    return table_catalogue
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy import DateTime
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.base import Base
 from src.db.types import str_64
@@ -14,9 +16,11 @@ if TYPE_CHECKING:
 class Table(Base):
     name: Mapped[str_64]
     seats: Mapped[int]
+    retired_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
     bookings: Mapped[list["Booking"]] = relationship(
         "Booking",
         back_populates="table",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
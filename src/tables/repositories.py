@@ -1,9 +1,11 @@
 from datetime import datetime
 
-from sqlalchemy import insert, select
+from sqlalchemy import and_, delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.bookings.index import booking_index
 from src.bookings.models import Booking, BookingStatus
+from src.core.time_utils import utc_now
 from src.tables.models import Table
 
 
@@ -24,18 +26,75 @@ class TableRepository:
         start_time: datetime,
         end_time: datetime,
         seats: int | None = None,
+        best_fit: bool = False,
     ) -> list[Table]:
-        busy_tables = (
+        stmt = select(Table).where(Table.retired_at.is_(None))
+        if booking_index.ready:
+            busy_ids = booking_index.busy_tables(start_time, end_time)
+            stmt = stmt.where(Table.id.not_in(list(busy_ids)))
+        else:
+            busy_tables = (
+                select(Booking.table_id)
+                .where(Booking.status == BookingStatus.ACTIVE)
+                .where(Booking.start_time < end_time)
+                .where(Booking.end_time > start_time)
+            )
+            stmt = stmt.where(Table.id.not_in(busy_tables))
+        if seats is not None:
+            stmt = stmt.where(Table.seats >= seats)
+        if best_fit:
+            stmt = stmt.order_by(Table.seats, Table.id)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_busy_table_ids(
+        self, start_time: datetime, end_time: datetime
+    ) -> set[int]:
+        if booking_index.ready:
+            return set(booking_index.busy_tables(start_time, end_time))
+        result = await self.session.execute(
             select(Booking.table_id)
             .where(Booking.status == BookingStatus.ACTIVE)
             .where(Booking.start_time < end_time)
             .where(Booking.end_time > start_time)
         )
-        stmt = select(Table).where(Table.id.not_in(busy_tables))
+        return set(result.scalars().all())
+
+    async def get_busy_intervals(
+        self, start_time: datetime, end_time: datetime
+    ) -> list[tuple[int, datetime, datetime]]:
+        result = await self.session.execute(
+            select(Booking.table_id, Booking.start_time, Booking.end_time)
+            .where(Booking.status == BookingStatus.ACTIVE)
+            .where(Booking.start_time < end_time)
+            .where(Booking.end_time > start_time)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def get_with_bookings(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        seats: int | None = None,
+    ) -> list[tuple[Table, datetime | None, datetime | None]]:
+        stmt = (
+            select(Table, Booking.start_time, Booking.end_time)
+            .outerjoin(
+                Booking,
+                and_(
+                    Booking.table_id == Table.id,
+                    Booking.status == BookingStatus.ACTIVE,
+                    Booking.start_time < end_time,
+                    Booking.end_time > start_time,
+                ),
+            )
+            .where(Table.retired_at.is_(None))
+            .order_by(Table.id, Booking.start_time)
+        )
         if seats is not None:
             stmt = stmt.where(Table.seats >= seats)
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return [(table, start, end) for table, start, end in result.all()]
 
     async def create(self, name: str, seats: int) -> int:
         stmt = insert(Table).values(name=name, seats=seats).returning(Table.id)
@@ -44,6 +103,16 @@ class TableRepository:
         await self.session.commit()
         return table_id
 
+    async def create_many(self, tables: list[tuple[str, int]]) -> list[Table]:
+        # One executemany that SQLAlchemy batches into multi-row INSERTs.
+        stmt = insert(Table).returning(Table, sort_by_parameter_order=True)
+        result = await self.session.execute(
+            stmt, [{"name": name, "seats": seats} for name, seats in tables]
+        )
+        created = list(result.scalars().all())
+        await self.session.commit()
+        return created
+
     async def update(
         self,
         table: Table,
@@ -58,6 +127,28 @@ class TableRepository:
         await self.session.refresh(table)
         return table
 
-    async def delete(self, table: Table) -> None:
-        await self.session.delete(table)
+    async def get_bookable_ids(self, table_ids: set[int]) -> set[int]:
+        result = await self.session.execute(
+            select(Table.id)
+            .where(Table.id.in_(table_ids))
+            .where(Table.retired_at.is_(None))
+        )
+        return set(result.scalars().all())
+
+    async def set_retired(self, table_id: int, retired: bool) -> Table | None:
+        stmt = (
+            update(Table)
+            .where(Table.id == table_id)
+            .values(retired_at=utc_now() if retired else None)
+            .returning(Table)
+        )
+        result = await self.session.execute(stmt)
+        table = result.scalar_one_or_none()
+        await self.session.commit()
+        return table
+
+    async def delete(self, table_id: int) -> bool:
+        # Bookings go with it through ON DELETE CASCADE.
+        result = await self.session.execute(delete(Table).where(Table.id == table_id))
         await self.session.commit()
+        return result.rowcount > 0
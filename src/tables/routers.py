@@ -1,19 +1,54 @@
+import csv
+import io
 from datetime import date as date_type
 from datetime import time as time_type
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.dependencies import get_current_admin, get_current_user
-from src.auth.models import User
+from src.auth.schemas import CurrentUser
+from src.core.etag import etag_matches, make_etag
 from src.core.logging_decorators import log_endpoint
 from src.db.session import get_session
+from src.tables.cache import get_availability_cache
+from src.tables.catalogue import get_table_catalogue
 from src.tables.repositories import TableRepository
-from src.tables.schemas import TableCreate, TableRead, TableUpdate
+from src.tables.schemas import (
+    AvailableSlotRead,
+    DayAvailabilityRead,
+    TableBulkCreate,
+    TableCreate,
+    TableRead,
+    TableUpdate,
+)
 from src.tables.services import TableService
 
 router = APIRouter(prefix="/tables", tags=["tables"])
 
+# TableCreate is already a component through POST /tables/.
+BULK_JSON_SCHEMA = TableBulkCreate.model_json_schema(
+    ref_template="#/components/schemas/{model}"
+)
+BULK_JSON_SCHEMA.pop("$defs", None)
+
+
+async def _read_bulk_payload(request: Request) -> TableBulkCreate:
+    body = await request.body()
+    try:
+        if request.headers.get("content-type", "").startswith("text/csv"):
+            reader = csv.DictReader(io.StringIO(body.decode("utf-8-sig")))
+            return TableBulkCreate.model_validate({"items": list(reader)})
+        return TableBulkCreate.model_validate_json(body)
+    except UnicodeDecodeError as exc:
+        raise RequestValidationError(
+            [{"type": "value_error", "loc": ("body",), "msg": str(exc)}]
+        ) from exc
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors(include_url=False)) from exc
+
 
 @router.get(
     "/available",
@@ -44,10 +79,85 @@ async def list_available_tables(
     _current_user: object = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> list[TableRead]:
-    service = TableService(TableRepository(session))
+    service = TableService(
+        TableRepository(session), get_availability_cache(), get_table_catalogue()
+    )
     return await service.list_available_tables(date, time, seats)
 
 
+@router.get(
+    "/availability",
+    response_model=DayAvailabilityRead,
+    summary="Get day availability",
+    description=(
+        "Returns, for every table, the start times of all free 2-hour slots "
+        "on the requested date."
+    ),
+)
+@log_endpoint
+async def get_day_availability(
+    date: date_type = Query(
+        ...,
+        description="Booking date in YYYY-MM-DD format.",
+        examples=["2026-02-07"],
+    ),
+    seats: int | None = Query(
+        default=None,
+        description="Minimum number of seats required.",
+        ge=1,
+        examples=[2],
+    ),
+    _current_user: object = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> DayAvailabilityRead:
+    service = TableService(
+        TableRepository(session), get_availability_cache(), get_table_catalogue()
+    )
+    return await service.get_day_availability(date, seats)
+
+
+@router.get(
+    "/next-available",
+    response_model=list[AvailableSlotRead],
+    summary="Get next available slots",
+    description=(
+        "Returns the free table/start-time pairs closest to the requested "
+        "date/time within working hours and the booking horizon."
+    ),
+)
+@log_endpoint
+async def find_next_available(
+    date: date_type = Query(
+        ...,
+        description="Desired booking date in YYYY-MM-DD format.",
+        examples=["2026-02-07"],
+    ),
+    time: time_type = Query(
+        ...,
+        description="Desired start time in HH:MM (24-hour) format.",
+        examples=["19:30"],
+    ),
+    seats: int | None = Query(
+        default=None,
+        description="Minimum number of seats required.",
+        ge=1,
+        examples=[2],
+    ),
+    limit: int = Query(
+        default=5,
+        description="Maximum number of slots to return.",
+        ge=1,
+        le=50,
+    ),
+    _current_user: object = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> list[AvailableSlotRead]:
+    service = TableService(
+        TableRepository(session), get_availability_cache(), get_table_catalogue()
+    )
+    return await service.find_next_available(date, time, seats, limit)
+
+
 @router.post(
     "/",
     response_model=TableRead,
@@ -58,14 +168,55 @@ async def list_available_tables(
 @log_endpoint
 async def create_table(
     payload: TableCreate,
-    _current_admin: User = Depends(get_current_admin),
+    _current_admin: CurrentUser = Depends(get_current_admin),
     session: AsyncSession = Depends(get_session),
 ) -> TableRead:
-    service = TableService(TableRepository(session))
+    service = TableService(
+        TableRepository(session), get_availability_cache(), get_table_catalogue()
+    )
     table = await service.create_table(payload.name, payload.seats)
     return TableRead.model_validate(table)
 
 
+@router.post(
+    "/bulk",
+    response_model=list[TableRead],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create tables in bulk (admin)",
+    description=(
+        "Creates up to 1000 tables in one insert. Accepts JSON "
+        '(`{"items": [{"name": ..., "seats": ...}]}`) or `text/csv` with a '
+        "`name,seats` header. Admin access required."
+    ),
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": BULK_JSON_SCHEMA},
+                "text/csv": {
+                    "schema": {"type": "string"},
+                    "example": "name,seats\nT2-1,2\nT4-1,4\n",
+                },
+            },
+        }
+    },
+)
+@log_endpoint
+async def create_tables_bulk(
+    request: Request,
+    _current_admin: CurrentUser = Depends(get_current_admin),
+    session: AsyncSession = Depends(get_session),
+) -> list[TableRead]:
+    payload = await _read_bulk_payload(request)
+    service = TableService(
+        TableRepository(session), get_availability_cache(), get_table_catalogue()
+    )
+    tables = await service.create_tables(
+        [(item.name, item.seats) for item in payload.items]
+    )
+    return [TableRead.model_validate(table) for table in tables]
+
+
 @router.get(
     "/",
     response_model=list[TableRead],
@@ -74,12 +225,22 @@ async def create_table(
 )
 @log_endpoint
 async def get_tables(
-    _current_admin: User = Depends(get_current_admin),
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    _current_admin: CurrentUser = Depends(get_current_admin),
     session: AsyncSession = Depends(get_session),
-) -> list[TableRead]:
-    service = TableService(TableRepository(session))
+) -> list[TableRead] | Response:
+    service = TableService(
+        TableRepository(session), get_availability_cache(), get_table_catalogue()
+    )
     tables = await service.get_tables()
-    return [TableRead.model_validate(table) for table in tables]
+    etag = make_etag(*tables)
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    response.headers["ETag"] = etag
+    return tables
 
 
 @router.get(
@@ -91,12 +252,22 @@ async def get_tables(
 @log_endpoint
 async def get_table(
     table_id: int,
-    _current_admin: User = Depends(get_current_admin),
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    _current_admin: CurrentUser = Depends(get_current_admin),
     session: AsyncSession = Depends(get_session),
-) -> TableRead:
-    service = TableService(TableRepository(session))
+) -> TableRead | Response:
+    service = TableService(
+        TableRepository(session), get_availability_cache(), get_table_catalogue()
+    )
     table = await service.get_table(table_id)
-    return TableRead.model_validate(table)
+    etag = make_etag(table)
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    response.headers["ETag"] = etag
+    return table
 
 
 @router.patch(
@@ -109,26 +280,73 @@ async def get_table(
 async def update_table(
     table_id: int,
     payload: TableUpdate,
-    _current_admin: User = Depends(get_current_admin),
+    _current_admin: CurrentUser = Depends(get_current_admin),
     session: AsyncSession = Depends(get_session),
 ) -> TableRead:
-    service = TableService(TableRepository(session))
+    service = TableService(
+        TableRepository(session), get_availability_cache(), get_table_catalogue()
+    )
     table = await service.update_table(table_id, payload.name, payload.seats)
     return TableRead.model_validate(table)
 
 
+@router.post(
+    "/{table_id}/retire",
+    response_model=TableRead,
+    summary="Retire table (admin)",
+    description=(
+        "Hides a table from availability and new bookings while keeping its "
+        "booking history. Admin access required."
+    ),
+)
+@log_endpoint
+async def retire_table(
+    table_id: int,
+    _current_admin: CurrentUser = Depends(get_current_admin),
+    session: AsyncSession = Depends(get_session),
+) -> TableRead:
+    service = TableService(
+        TableRepository(session), get_availability_cache(), get_table_catalogue()
+    )
+    table = await service.set_table_retired(table_id, True)
+    return TableRead.model_validate(table)
+
+
+@router.post(
+    "/{table_id}/restore",
+    response_model=TableRead,
+    summary="Restore table (admin)",
+    description="Makes a retired table bookable again. Admin access required.",
+)
+@log_endpoint
+async def restore_table(
+    table_id: int,
+    _current_admin: CurrentUser = Depends(get_current_admin),
+    session: AsyncSession = Depends(get_session),
+) -> TableRead:
+    service = TableService(
+        TableRepository(session), get_availability_cache(), get_table_catalogue()
+    )
+    table = await service.set_table_retired(table_id, False)
+    return TableRead.model_validate(table)
+
+
 @router.delete(
     "/{table_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete table (admin)",
-    description="Deletes a table by id. Admin access required.",
+    description=(
+        "Deletes a table and its whole booking history. Admin access required."
+    ),
 )
 @log_endpoint
 async def delete_table(
     table_id: int,
-    _current_admin: User = Depends(get_current_admin),
+    _current_admin: CurrentUser = Depends(get_current_admin),
     session: AsyncSession = Depends(get_session),
 ) -> Response:
-    service = TableService(TableRepository(session))
+    service = TableService(
+        TableRepository(session), get_availability_cache(), get_table_catalogue()
+    )
     await service.delete_table(table_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,3 +1,8 @@
+from datetime import date as date_type
+from datetime import datetime
+from datetime import time as time_type
+from typing import Annotated
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -7,6 +12,7 @@ class TableRead(BaseModel):
     id: int
     name: str
     seats: int
+    retired_at: datetime | None = None
 
 
 class TableCreate(BaseModel):
@@ -14,6 +20,32 @@ class TableCreate(BaseModel):
     seats: int = Field(ge=1, examples=[2])
 
 
+class TableBulkCreate(BaseModel):
+    items: Annotated[list[TableCreate], Field(min_length=1, max_length=1000)]
+
+
 class TableUpdate(BaseModel):
     name: str | None = Field(default=None, examples=["Table 12"])
     seats: int | None = Field(default=None, ge=1, examples=[6])
+
+
+class TableAvailabilityRead(BaseModel):
+    id: int
+    name: str
+    seats: int
+    available_times: list[time_type]
+
+
+class DayAvailabilityRead(BaseModel):
+    date: date_type
+    slot_minutes: int
+    duration_minutes: int
+    tables: list[TableAvailabilityRead]
+
+
+class AvailableSlotRead(BaseModel):
+    table_id: int
+    name: str
+    seats: int
+    date: date_type
+    time: time_type
@@ -1,33 +1,52 @@
+from bisect import bisect_right
 from datetime import date, datetime, time, timedelta
 
 from src.core.config import settings
-from src.core.errors import BusinessError, NotFoundError
+from src.core.errors import NotFoundError
 from src.core.logging_decorators import log_service
-from src.core.time_utils import (
-    combine_local,
-    is_past,
-    is_valid_slot_time,
-    is_within_horizon,
-    normalize_time,
-    to_utc,
-)
+from src.core.slots import SlotCalendar, slot_calendar
+from src.core.time_utils import normalize_time, to_utc
+from src.tables.cache import AvailabilityCache
+from src.tables.catalogue import TableCatalogue
+from src.tables.models import Table
 from src.tables.repositories import TableRepository
+from src.tables.schemas import (
+    AvailableSlotRead,
+    DayAvailabilityRead,
+    TableAvailabilityRead,
+    TableRead,
+)
 
 
 class TableService:
-    def __init__(self, tables: TableRepository) -> None:
+    def __init__(
+        self,
+        tables: TableRepository,
+        availability_cache: AvailabilityCache | None = None,
+        catalogue: TableCatalogue | None = None,
+        calendar: SlotCalendar = slot_calendar,
+    ) -> None:
         self.tables = tables
+        self.availability_cache = availability_cache
+        self.catalogue = catalogue
+        self.calendar = calendar
 
     @log_service
-    async def get_tables(self):
-        return await self.tables.get_all()
+    async def get_tables(self) -> list[TableRead]:
+        if self.catalogue:
+            return await self.catalogue.get_all(self.tables)
+        tables = await self.tables.get_all()
+        return [TableRead.model_validate(table) for table in tables]
 
     @log_service
-    async def get_table(self, table_id: int):
-        table = await self.tables.get_by_id(table_id)
+    async def get_table(self, table_id: int) -> TableRead:
+        if self.catalogue:
+            table = await self.catalogue.get(self.tables, table_id)
+        else:
+            table = await self.tables.get_by_id(table_id)
         if not table:
             raise NotFoundError("Table not found")
-        return table
+        return TableRead.model_validate(table)
 
     @log_service
     async def create_table(self, name: str, seats: int):
@@ -35,8 +54,15 @@ class TableService:
         table = await self.tables.get_by_id(table_id)
         if not table:
             raise NotFoundError("Table not found")
+        await self._invalidate_catalogue()
         return table
 
+    @log_service
+    async def create_tables(self, tables: list[tuple[str, int]]) -> list[Table]:
+        created = await self.tables.create_many(tables)
+        await self._invalidate_catalogue()
+        return created
+
     @log_service
     async def update_table(
         self,
@@ -47,14 +73,23 @@ class TableService:
         table = await self.tables.get_by_id(table_id)
         if not table:
             raise NotFoundError("Table not found")
-        return await self.tables.update(table, name, seats)
+        table = await self.tables.update(table, name, seats)
+        await self._invalidate_catalogue()
+        return table
 
     @log_service
     async def delete_table(self, table_id: int) -> None:
-        table = await self.tables.get_by_id(table_id)
+        if not await self.tables.delete(table_id):
+            raise NotFoundError("Table not found")
+        await self._invalidate_catalogue()
+
+    @log_service
+    async def set_table_retired(self, table_id: int, retired: bool) -> Table:
+        table = await self.tables.set_retired(table_id, retired)
         if not table:
             raise NotFoundError("Table not found")
-        await self.tables.delete(table)
+        await self._invalidate_catalogue()
+        return table
 
     @log_service
     async def list_available_tables(
@@ -62,43 +97,177 @@ class TableService:
         target_date: date,
         target_time: time,
         seats: int | None = None,
-    ):
-        target_time = self._normalize_time(target_time)
-        local_start = combine_local(target_date, target_time)
-        local_end = local_start + timedelta(
-            minutes=settings.booking_duration_minutes
+    ) -> list[TableRead]:
+        start_time, end_time = self.calendar.build_slot(target_date, target_time)
+        if self.availability_cache:
+            cached = await self.availability_cache.get(start_time, seats)
+            if cached is not None:
+                return [TableRead.model_validate(table) for table in cached]
+
+        if self.catalogue:
+            busy_ids = await self.tables.get_busy_table_ids(start_time, end_time)
+            tables = [
+                table
+                for table in self._bookable(
+                    await self.catalogue.get_all(self.tables), seats
+                )
+                if table.id not in busy_ids
+            ]
+        else:
+            tables = [
+                TableRead.model_validate(table)
+                for table in await self.tables.get_available(
+                    start_time, end_time, seats
+                )
+            ]
+        if self.availability_cache:
+            await self.availability_cache.set(
+                start_time, seats, [table.model_dump(mode="json") for table in tables]
+            )
+        return tables
+
+    @log_service
+    async def get_day_availability(
+        self,
+        target_date: date,
+        seats: int | None = None,
+    ) -> DayAvailabilityRead:
+        slots = self.calendar.open_slots(target_date)
+        bounds = self.calendar.day_bounds(target_date)
+        if bounds is None:
+            # Closed all day: no slots, but every table is still listed.
+            midnight = to_utc(
+                datetime.combine(target_date, time.min, self.calendar.timezone)
+            )
+            bounds = (midnight, midnight)
+
+        tables, busy = await self._load_bookings(*bounds, seats)
+
+        return DayAvailabilityRead(
+            date=target_date,
+            slot_minutes=settings.booking_slot_minutes,
+            duration_minutes=settings.booking_duration_minutes,
+            tables=[
+                TableAvailabilityRead(
+                    id=table.id,
+                    name=table.name,
+                    seats=table.seats,
+                    available_times=[
+                        slot.time()
+                        for slot in slots
+                        if self._is_free(
+                            busy[table.id], to_utc(slot), self.calendar.duration
+                        )
+                    ],
+                )
+                for table in tables.values()
+            ],
         )
 
-        self._ensure_within_working_hours(local_start, local_end)
-        self._ensure_same_day(local_start, local_end)
-        self._ensure_booking_window(local_start)
+    async def _invalidate_catalogue(self) -> None:
+        if self.catalogue:
+            await self.catalogue.bump()
+        if self.availability_cache:
+            await self.availability_cache.invalidate_all()
 
-        start_time = to_utc(local_start)
-        end_time = to_utc(local_end)
-        return await self.tables.get_available(start_time, end_time, seats)
+    @log_service
+    async def find_next_available(
+        self,
+        target_date: date,
+        target_time: time,
+        seats: int | None = None,
+        limit: int = 5,
+    ) -> list[AvailableSlotRead]:
+        requested = to_utc(
+            datetime.combine(
+                target_date, normalize_time(target_time), self.calendar.timezone
+            )
+        )
+        slots = [
+            slot
+            for day in self.calendar.horizon_dates()
+            for slot in self.calendar.open_slots(day)
+        ]
+        if not slots:
+            return []
 
-    @staticmethod
-    def _ensure_within_working_hours(start_time: datetime, end_time: datetime) -> None:
-        open_time = time.fromisoformat(settings.booking_open_time)
-        close_time = time.fromisoformat(settings.booking_close_time)
+        duration = self.calendar.duration
+        by_id, busy = await self._load_bookings(
+            to_utc(slots[0]), to_utc(slots[-1]) + duration, seats
+        )
+        tables = sorted(by_id.values(), key=lambda table: (table.seats, table.id))
 
-        if start_time.time() < open_time or end_time.time() > close_time:
-            raise BusinessError("Requested time is outside of working hours")
+        slots.sort(key=lambda slot: (abs(to_utc(slot) - requested), slot))
+        found: list[AvailableSlotRead] = []
+        for slot in slots:
+            start_time = to_utc(slot)
+            for table in tables:
+                if not self._is_free(busy[table.id], start_time, duration):
+                    continue
+                found.append(
+                    AvailableSlotRead(
+                        table_id=table.id,
+                        name=table.name,
+                        seats=table.seats,
+                        date=slot.date(),
+                        time=slot.time(),
+                    )
+                )
+                if len(found) == limit:
+                    return found
+        return found
 
     @staticmethod
-    def _ensure_same_day(start_time: datetime, end_time: datetime) -> None:
-        if end_time.date() != start_time.date():
-            raise BusinessError("Requested time is outside of working hours")
+    def _bookable(tables: list[TableRead], seats: int | None) -> list[TableRead]:
+        return [
+            table
+            for table in tables
+            if table.retired_at is None and (seats is None or table.seats >= seats)
+        ]
 
-    @staticmethod
-    def _normalize_time(target_time: time) -> time:
-        return normalize_time(target_time)
+    async def _load_bookings(
+        self, start_time: datetime, end_time: datetime, seats: int | None
+    ) -> tuple[
+        dict[int, Table | TableRead], dict[int, list[tuple[datetime, datetime]]]
+    ]:
+        """Bookable tables by id and each table's busy intervals, sorted by end.
+
+        With the catalogue only the bookings are queried; otherwise tables and
+        bookings come from one outer join.
+        """
+        tables: dict[int, Table | TableRead] = {}
+        busy: dict[int, list[tuple[datetime, datetime]]] = {}
+        if self.catalogue:
+            catalogue = await self.catalogue.get_all(self.tables)
+            for table in self._bookable(catalogue, seats):
+                tables[table.id] = table
+                busy[table.id] = []
+            bookings = await self.tables.get_busy_intervals(start_time, end_time)
+            for table_id, booking_start, booking_end in bookings:
+                if table_id in busy:
+                    busy[table_id].append((to_utc(booking_start), to_utc(booking_end)))
+        else:
+            rows = await self.tables.get_with_bookings(start_time, end_time, seats)
+            for table, booking_start, booking_end in rows:
+                tables[table.id] = table
+                intervals = busy.setdefault(table.id, [])
+                if booking_start is not None and booking_end is not None:
+                    intervals.append((to_utc(booking_start), to_utc(booking_end)))
+        for intervals in busy.values():
+            intervals.sort(key=lambda interval: interval[1])
+        return tables, busy
 
     @staticmethod
-    def _ensure_booking_window(start_time: datetime) -> None:
-        if is_past(start_time):
-            raise BusinessError("Booking time cannot be in the past")
-        if not is_within_horizon(start_time, settings.booking_max_days_ahead):
-            raise BusinessError("Booking date is too far in the future")
-        if not is_valid_slot_time(start_time, settings.booking_slot_minutes):
-            raise BusinessError("Booking time must align to the slot minutes")
+    def _is_free(
+        intervals: list[tuple[datetime, datetime]],
+        start_time: datetime,
+        duration: timedelta,
+    ) -> bool:
+        # Active bookings of a table never overlap, so sorting them by end
+        # time also sorts them by start: only the first one ending after
+        # ``start_time`` can conflict.
+        position = bisect_right(intervals, start_time, key=lambda interval: interval[1])
+        return (
+            position == len(intervals)
+            or intervals[position][0] >= start_time + duration
+        )
@@ -14,6 +14,12 @@ celery_app.conf.update(
     result_serializer="json",
     enable_utc=True,
     timezone="UTC",
+    beat_schedule={
+        "send-due-booking-reminders": {
+            "task": "send_due_booking_reminders",
+            "schedule": settings.booking_reminder_sweep_seconds,
+        },
+    },
 )
 
 celery_app.autodiscover_tasks(["src.tasks"])
@@ -1,6 +1,13 @@
-from datetime import datetime
+import asyncio
+from datetime import timedelta
 
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.bookings.repositories import BookingRepository
+from src.core.config import build_database_url, settings
 from src.core.email import send_email
+from src.core.time_utils import to_utc, utc_now
 from src.tasks.celery_app import celery_app
 
 
@@ -16,3 +23,34 @@ def send_booking_reminder(email: str, full_name: str, start_time: str) -> None:
     subject = "Booking reminder"
     body = f"Hi {full_name}, reminder about your booking at {start_time}."
     send_email(email, subject, body)
+
+
+@celery_app.task(name="send_due_booking_reminders")
+def send_due_booking_reminders() -> int:
+    return asyncio.run(dispatch_due_reminders())
+
+
+async def dispatch_due_reminders() -> int:
+    # Each task run has its own event loop, so pooled connections can't be reused.
+    engine = create_async_engine(build_database_url(settings), poolclass=NullPool)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    due_before = utc_now() + timedelta(minutes=settings.booking_reminder_lead_minutes)
+    dispatched = 0
+    try:
+        while True:
+            async with session_factory() as session:
+                reminders = await BookingRepository(session).claim_due_reminders(
+                    due_before, settings.booking_reminder_batch_size
+                )
+                await session.commit()
+            # Enqueue only once the claim is durable, so a failed commit
+            # cannot leave queued emails for rows that are retried later.
+            for email, full_name, start_time in reminders:
+                send_booking_reminder.delay(
+                    email, full_name, to_utc(start_time).isoformat()
+                )
+            dispatched += len(reminders)
+            if len(reminders) < settings.booking_reminder_batch_size:
+                return dispatched
+    finally:
+        await engine.dispose()
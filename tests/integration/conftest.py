@@ -5,10 +5,12 @@ import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from src.auth.cache import user_identity_cache
 from src.core.config import settings
 from src.db.base import Base
 from src.db.session import get_session
 from src.main import create_app
+from src.tables.catalogue import table_catalogue
 
 
 @pytest_asyncio.fixture
@@ -36,6 +38,9 @@ async def db_session(session_factory):
 async def app(session_factory):
     settings.jwt_secret = "testsecret"
     settings.jwt_algorithm = "HS256"
+    # User and table ids restart in every test database.
+    user_identity_cache.clear()
+    table_catalogue.clear()
 
     app = create_app()
 
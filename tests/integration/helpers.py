@@ -1,3 +1,4 @@
+from typing import Any
 from uuid import uuid4
 
 from src.auth.models import User
@@ -35,3 +36,26 @@ async def create_table(session, name: str = "T1", seats: int = 2) -> Table:
     await session.commit()
     await session.refresh(table)
     return table
+
+
+class InMemoryRedis:
+    """The few Redis commands the token store uses."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, Any] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.values.get(key)
+
+    async def mget(self, *keys: str) -> list[Any]:
+        return [self.values.get(key) for key in keys]
+
+    async def set(self, key: str, value: Any, ex: int, nx: bool) -> bool:
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        return True
+
+    async def incr(self, key: str) -> int:
+        self.values[key] = int(self.values.get(key, 0)) + 1
+        return self.values[key]
@@ -1,6 +1,16 @@
 import pytest
+from sqlalchemy import select
 
+from src.auth.models import User
+from src.auth.tokens import token_store
+from src.core.security import (
+    decode_access_token,
+    password_needs_rehash,
+    pwd_context,
+    verify_password,
+)
 from src.tasks import tasks as celery_tasks
+from tests.integration.helpers import InMemoryRedis, create_user
 
 
 @pytest.mark.asyncio
@@ -24,3 +34,76 @@ async def test_register_returns_token(client, monkeypatch) -> None:
     assert response.status_code == 200
     data = response.json()
     assert "access_token" in data
+
+
+@pytest.mark.asyncio
+async def test_login_token_claims_authorize_admin_and_refresh(
+    client, db_session, monkeypatch
+) -> None:
+    monkeypatch.setattr(token_store, "redis", InMemoryRedis())
+    admin = await create_user(db_session, password="password", is_admin=True)
+
+    login = await client.post(
+        "/auth/login", json={"email": admin.email, "password": "password"}
+    )
+    tokens = login.json()
+    tables = await client.get(
+        "/tables/", headers={"Authorization": f"Bearer {tokens['access_token']}"}
+    )
+    refreshed = await client.post(
+        "/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    replayed = await client.post(
+        "/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    access_as_refresh = await client.post(
+        "/auth/refresh", json={"refresh_token": tokens["access_token"]}
+    )
+
+    assert login.status_code == 200
+    assert decode_access_token(tokens["access_token"]).adm is True
+    assert tables.status_code == 200
+    assert refreshed.status_code == 200
+    assert refreshed.json()["refresh_token"] != tokens["refresh_token"]
+    assert replayed.status_code == 401
+    assert access_as_refresh.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_register_rejects_taken_email(client, db_session) -> None:
+    user = await create_user(db_session)
+
+    response = await client.post(
+        "/auth/register",
+        json={
+            "email": user.email,
+            "password": "password",
+            "full_name": "New User",
+            "phone_number": "1234567890",
+        },
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email already registered"
+
+
+@pytest.mark.asyncio
+async def test_login_upgrades_outdated_password_hash(client, session_factory) -> None:
+    async with session_factory() as session:
+        user = await create_user(session)
+        legacy = pwd_context.handler("bcrypt").using(rounds=4)
+        user.hashed_password = legacy.hash("password")
+        await session.commit()
+
+    response = await client.post(
+        "/auth/login", json={"email": user.email, "password": "password"}
+    )
+
+    async with session_factory() as session:
+        hashed_password = await session.scalar(
+            select(User.hashed_password).where(User.id == user.id)
+        )
+    assert response.status_code == 200
+    assert hashed_password.startswith("$bcrypt-sha256$")
+    assert not password_needs_rehash(hashed_password)
+    assert verify_password("password", hashed_password)
@@ -0,0 +1,77 @@
+import os
+from datetime import timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.auth.models import User
+from src.bookings.repositories import BookingRepository
+from src.core.errors import BusinessError
+from src.core.time_utils import utc_now
+from src.db.base import Base
+from src.tables.models import Table
+
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+pytestmark = pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+
+
+@pytest_asyncio.fixture
+async def pg_session_factory():
+    engine = create_async_engine(str(POSTGRES_URL), future=True)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(insert(Table), [{"name": "T1", "seats": 4}])
+        await connection.execute(
+            insert(User),
+            [
+                {
+                    "email": f"user-{index}@example.com",
+                    "hashed_password": "x",
+                    "full_name": "Overlap User",
+                    "phone_number": "100200300",
+                    "is_admin": False,
+                    "created_at": utc_now(),
+                }
+                for index in range(2)
+            ],
+        )
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_double_booking_is_rejected(pg_session_factory) -> None:
+    start_time = utc_now().replace(microsecond=0) + timedelta(days=7)
+    end_time = start_time + timedelta(hours=2)
+
+    async with pg_session_factory() as session:
+        await BookingRepository(session).create(1, 1, start_time, end_time, start_time)
+
+    async with pg_session_factory() as session:
+        with pytest.raises(BusinessError):
+            await BookingRepository(session).create(
+                2,
+                1,
+                start_time + timedelta(hours=1),
+                end_time + timedelta(hours=1),
+                start_time,
+            )
+
+
+@pytest.mark.asyncio
+async def test_adjacent_bookings_are_allowed(pg_session_factory) -> None:
+    start_time = utc_now().replace(microsecond=0) + timedelta(days=7)
+    end_time = start_time + timedelta(hours=2)
+
+    async with pg_session_factory() as session:
+        repository = BookingRepository(session)
+        await repository.create(1, 1, start_time, end_time, start_time)
+        await repository.create(
+            2, 1, end_time, end_time + timedelta(hours=2), start_time
+        )
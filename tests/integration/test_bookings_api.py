@@ -1,19 +1,15 @@
-from datetime import date, timedelta
+import json
+from datetime import date, time, timedelta
 
 import pytest
 
-from src.tasks import tasks as celery_tasks
+from src.bookings.models import Booking, BookingStatus
+from src.core.time_utils import combine_local, to_utc
 from tests.integration.helpers import auth_header, create_table, create_user
 
 
 @pytest.mark.asyncio
-async def test_create_booking(client, db_session, monkeypatch) -> None:
-    monkeypatch.setattr(
-        celery_tasks.send_booking_reminder,
-        "apply_async",
-        lambda *args, **kwargs: None,
-    )
-
+async def test_create_booking(client, db_session) -> None:
     user = await create_user(db_session)
     table = await create_table(db_session, name="T-1", seats=2)
 
@@ -33,3 +29,169 @@ async def test_create_booking(client, db_session, monkeypatch) -> None:
     data = response.json()
     assert data["table_id"] == table.id
     assert data["user_id"] == user.id
+
+
+@pytest.mark.asyncio
+async def test_create_bookings_batch(client, db_session) -> None:
+    user = await create_user(db_session)
+    first = await create_table(db_session, name="T-1", seats=2)
+    second = await create_table(db_session, name="T-2", seats=4)
+    booking_date = (date.today() + timedelta(days=2)).isoformat()
+
+    response = await client.post(
+        "/bookings/batch",
+        json={
+            "items": [
+                {"table_id": first.id, "date": booking_date, "time": "19:00"},
+                {"table_id": second.id, "date": booking_date, "time": "19:00"},
+            ]
+        },
+        headers=auth_header(user.id),
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert [item["table_id"] for item in data] == [first.id, second.id]
+
+
+@pytest.mark.asyncio
+async def test_create_bookings_batch_rejects_overlap(client, db_session) -> None:
+    user = await create_user(db_session)
+    table = await create_table(db_session, name="T-1", seats=2)
+    booking_date = (date.today() + timedelta(days=2)).isoformat()
+
+    response = await client.post(
+        "/bookings/batch",
+        json={
+            "items": [
+                {"table_id": table.id, "date": booking_date, "time": "19:00"},
+                {"table_id": table.id, "date": booking_date, "time": "20:00"},
+            ]
+        },
+        headers=auth_header(user.id),
+    )
+
+    assert response.status_code == 400
+    assert "items: 2" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_list_my_bookings_paginates(client, db_session) -> None:
+    user = await create_user(db_session)
+    table = await create_table(db_session, name="T-1", seats=2)
+    start_time = to_utc(combine_local(date.today() + timedelta(days=2), time(12, 0)))
+    for offset in range(3):
+        db_session.add(
+            Booking(
+                user_id=user.id,
+                table_id=table.id,
+                start_time=start_time + timedelta(hours=2 * offset),
+                end_time=start_time + timedelta(hours=2 * offset + 2),
+            )
+        )
+    await db_session.commit()
+
+    first_page = await client.get(
+        "/bookings/my", params={"limit": 2}, headers=auth_header(user.id)
+    )
+    assert first_page.status_code == 200
+    assert len(first_page.json()) == 2
+    cursor = first_page.headers["X-Next-Cursor"]
+
+    second_page = await client.get(
+        "/bookings/my",
+        params={"limit": 2, "cursor": cursor},
+        headers=auth_header(user.id),
+    )
+    assert second_page.status_code == 200
+    assert len(second_page.json()) == 1
+    assert "X-Next-Cursor" not in second_page.headers
+    ids = [item["id"] for item in first_page.json() + second_page.json()]
+    assert len(set(ids)) == 3
+
+    other_listing = await client.get(
+        "/bookings/my",
+        params={"limit": 2, "cursor": cursor, "scope": "past"},
+        headers=auth_header(user.id),
+    )
+    other_user = await create_user(db_session)
+    foreign = await client.get(
+        "/bookings/my",
+        params={"limit": 2, "cursor": cursor},
+        headers=auth_header(other_user.id),
+    )
+    assert other_listing.status_code == 400
+    assert foreign.status_code == 400
+    assert foreign.json()["detail"] == "Invalid cursor"
+
+
+@pytest.mark.asyncio
+async def test_auto_booking_picks_smallest_fitting_table(client, db_session) -> None:
+    user = await create_user(db_session)
+    await create_table(db_session, name="T-6", seats=6)
+    small = await create_table(db_session, name="T-4", seats=4)
+    await create_table(db_session, name="T-2", seats=2)
+    payload = {
+        "seats": 3,
+        "date": (date.today() + timedelta(days=2)).isoformat(),
+        "time": "19:00",
+    }
+
+    response = await client.post(
+        "/bookings/auto", json=payload, headers=auth_header(user.id)
+    )
+
+    assert response.status_code == 201
+    assert response.json()["table_id"] == small.id
+
+
+@pytest.mark.asyncio
+async def test_admin_exports_bookings(client, db_session) -> None:
+    admin = await create_user(db_session, is_admin=True)
+    table = await create_table(db_session, name="T-1", seats=2)
+    target_date = date.today() + timedelta(days=2)
+    for day_offset, status in ((0, BookingStatus.ACTIVE), (1, BookingStatus.CANCELED)):
+        start_time = to_utc(
+            combine_local(target_date + timedelta(days=day_offset), time(19, 0))
+        )
+        db_session.add(
+            Booking(
+                user_id=admin.id,
+                table_id=table.id,
+                start_time=start_time,
+                end_time=start_time + timedelta(hours=2),
+                status=status,
+            )
+        )
+    await db_session.commit()
+
+    ndjson = await client.get("/bookings/export", headers=auth_header(admin.id))
+    csv_export = await client.get(
+        "/bookings/export",
+        params={
+            "format": "csv",
+            "status": "active",
+            "date_from": target_date.isoformat(),
+            "date_to": target_date.isoformat(),
+        },
+        headers=auth_header(admin.id),
+    )
+
+    assert ndjson.status_code == 200
+    assert ndjson.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert [row["status"] for row in rows] == ["active", "canceled"]
+    assert csv_export.status_code == 200
+    lines = csv_export.text.splitlines()
+    assert lines[0] == "id,user_id,table_id,start_time,end_time,status,created_at"
+    assert len(lines) == 2
+    assert ",active," in lines[1]
+
+
+@pytest.mark.asyncio
+async def test_user_cannot_export_bookings(client, db_session) -> None:
+    user = await create_user(db_session)
+
+    response = await client.get("/bookings/export", headers=auth_header(user.id))
+
+    assert response.status_code == 403
@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy import select
+
+from scripts.import_users import import_users
+from src.auth.models import User
+from src.core.security import verify_password
+from tests.integration.helpers import create_user
+
+
+@pytest.mark.asyncio
+async def test_import_skips_invalid_and_duplicate_emails(
+    tmp_path, session_factory, monkeypatch
+) -> None:
+    # Split the existing-email lookup into single-email statements.
+    monkeypatch.setattr("src.auth.repositories.EMAIL_LOOKUP_BATCH", 1)
+    async with session_factory() as session:
+        await create_user(session, email="taken@example.com")
+    csv_path = tmp_path / "users.csv"
+    csv_path.write_text(
+        "email,password,full_name,phone_number\n"
+        "first@example.com,password1,First User,100\n"
+        "taken@example.com,password2,Taken User,200\n"
+        "not-an-email,password3,Broken User,300\n"
+        "second@example.com,password4,Second User,400\n"
+        "first@example.com,password5,First Again,500\n",
+        encoding="utf-8",
+    )
+
+    stats = await import_users(
+        csv_path, chunk_size=2, workers=2, session_factory=session_factory
+    )
+
+    async with session_factory() as session:
+        users = {
+            user.email: user for user in (await session.scalars(select(User))).all()
+        }
+    assert stats == {"read": 5, "invalid": 1, "duplicate": 2, "inserted": 2}
+    assert set(users) == {
+        "taken@example.com",
+        "first@example.com",
+        "second@example.com",
+    }
+    assert users["first@example.com"].full_name == "First User"
+    assert verify_password("password1", users["first@example.com"].hashed_password)
+    assert users["second@example.com"].created_at is not None
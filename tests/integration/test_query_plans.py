@@ -0,0 +1,175 @@
+import os
+from datetime import timedelta
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.auth.models import User
+from src.bookings.models import Booking, BookingStatus
+from src.bookings.repositories import BookingRepository
+from src.core.time_utils import utc_now
+from src.db.base import Base
+from src.tables.models import Table
+from src.tables.repositories import TableRepository
+
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+pytestmark = pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+
+TABLES = 40
+USERS = 200
+HISTORY_DAYS = 365
+FUTURE_DAYS = 30
+
+
+@pytest_asyncio.fixture
+async def pg_engine():
+    engine = create_async_engine(str(POSTGRES_URL), future=True)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+    await _seed(engine)
+    yield engine
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+async def _seed(engine) -> None:
+    now = utc_now().replace(minute=0, second=0, microsecond=0)
+    async with engine.begin() as connection:
+        await connection.execute(
+            insert(Table),
+            [{"name": f"T{index}", "seats": 2 + index % 5} for index in range(TABLES)],
+        )
+        await connection.execute(
+            insert(User),
+            [
+                {
+                    "email": f"user-{index}@example.com",
+                    "hashed_password": "x",
+                    "full_name": "Plan User",
+                    "phone_number": "100200300",
+                    "is_admin": False,
+                    "created_at": now,
+                }
+                for index in range(USERS)
+            ],
+        )
+        bookings: list[dict[str, Any]] = []
+        for day in range(-HISTORY_DAYS, FUTURE_DAYS):
+            for table_id in range(1, TABLES + 1):
+                start_time = now + timedelta(days=day, hours=table_id % 8)
+                bookings.append(
+                    {
+                        "user_id": 1 + (day * TABLES + table_id) % USERS,
+                        "table_id": table_id,
+                        "start_time": start_time,
+                        "end_time": start_time + timedelta(hours=2),
+                        "status": (
+                            BookingStatus.CANCELED
+                            if table_id % 10 == 0
+                            else BookingStatus.ACTIVE
+                        ),
+                        "created_at": now,
+                    }
+                )
+        await connection.execute(insert(Booking), bookings)
+        await connection.execute(text("ANALYZE"))
+
+
+def _seq_scanned_relations(plan: dict[str, Any]) -> list[str]:
+    relations = []
+    if plan.get("Node Type") == "Seq Scan":
+        relations.append(plan.get("Relation Name", ""))
+    for child in plan.get("Plans", []):
+        relations.extend(_seq_scanned_relations(child))
+    return relations
+
+
+async def _assert_no_booking_seq_scan(engine, run_query) -> None:
+    statements: list[tuple[str, Any]] = []
+
+    def capture(_conn, _cursor, statement, parameters, _context, _executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        session_factory = async_sessionmaker(engine, class_=AsyncSession)
+        async with session_factory() as session:
+            await run_query(session)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    assert statements
+    async with engine.connect() as connection:
+        for statement, parameters in statements:
+            result = await connection.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {statement}", parameters
+            )
+            plan = result.scalar_one()[0]["Plan"]
+            assert "booking" not in _seq_scanned_relations(plan), statement
+
+
+@pytest.mark.asyncio
+async def test_list_conflicts_uses_index(pg_engine) -> None:
+    start_time = utc_now() + timedelta(days=7)
+
+    async def run_query(session: AsyncSession) -> None:
+        await BookingRepository(session).list_conflicts(
+            [
+                (table_id, start_time, start_time + timedelta(hours=2))
+                for table_id in range(1, 6)
+            ]
+        )
+
+    await _assert_no_booking_seq_scan(pg_engine, run_query)
+
+
+@pytest.mark.asyncio
+async def test_list_for_user_uses_index(pg_engine) -> None:
+    async def run_query(session: AsyncSession) -> None:
+        await BookingRepository(session).list_for_user(
+            7, [BookingStatus.ACTIVE], 21, starts_from=utc_now()
+        )
+
+    await _assert_no_booking_seq_scan(pg_engine, run_query)
+
+
+@pytest.mark.asyncio
+async def test_list_active_between_uses_index(pg_engine) -> None:
+    now = utc_now()
+
+    async def run_query(session: AsyncSession) -> None:
+        await BookingRepository(session).list_active_between(
+            now, now + timedelta(days=1)
+        )
+
+    await _assert_no_booking_seq_scan(pg_engine, run_query)
+
+
+@pytest.mark.asyncio
+async def test_get_available_uses_index(pg_engine) -> None:
+    start_time = utc_now() + timedelta(days=7)
+
+    async def run_query(session: AsyncSession) -> None:
+        await TableRepository(session).get_available(
+            start_time, start_time + timedelta(hours=2), 2
+        )
+
+    await _assert_no_booking_seq_scan(pg_engine, run_query)
+
+
+@pytest.mark.asyncio
+async def test_get_with_bookings_uses_index(pg_engine) -> None:
+    start_time = utc_now() + timedelta(days=7)
+
+    async def run_query(session: AsyncSession) -> None:
+        await TableRepository(session).get_with_bookings(
+            start_time, start_time + timedelta(hours=10)
+        )
+
+    await _assert_no_booking_seq_scan(pg_engine, run_query)
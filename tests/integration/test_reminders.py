@@ -0,0 +1,39 @@
+from datetime import timedelta
+
+import pytest
+
+from src.bookings.models import Booking, BookingStatus
+from src.bookings.repositories import BookingRepository
+from src.core.time_utils import utc_now
+from tests.integration.helpers import create_table, create_user
+
+
+@pytest.mark.asyncio
+async def test_claim_due_reminders_marks_bookings_once(db_session) -> None:
+    user = await create_user(db_session)
+    table = await create_table(db_session)
+    now = utc_now()
+    for start_time, status in [
+        (now + timedelta(hours=3), BookingStatus.ACTIVE),
+        (now + timedelta(hours=6), BookingStatus.CANCELED),
+        (now + timedelta(days=3), BookingStatus.ACTIVE),
+    ]:
+        db_session.add(
+            Booking(
+                user_id=user.id,
+                table_id=table.id,
+                start_time=start_time,
+                end_time=start_time + timedelta(hours=2),
+                status=status,
+            )
+        )
+    await db_session.commit()
+
+    repository = BookingRepository(db_session)
+    reminders = await repository.claim_due_reminders(now + timedelta(days=1), 10)
+    await db_session.commit()
+
+    assert [(email, name) for email, name, _ in reminders] == [
+        (user.email, user.full_name)
+    ]
+    assert await repository.claim_due_reminders(now + timedelta(days=1), 10) == []
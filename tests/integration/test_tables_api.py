@@ -1,6 +1,10 @@
+from datetime import date, time, timedelta
+
 import pytest
 
-from tests.integration.helpers import auth_header, create_user
+from src.bookings.models import Booking
+from src.core.time_utils import combine_local, to_utc
+from tests.integration.helpers import auth_header, create_table, create_user
 
 
 @pytest.mark.asyncio
@@ -25,3 +29,195 @@ async def test_user_cannot_list_tables(client, db_session) -> None:
 
     response = await client.get("/tables/", headers=auth_header(user.id))
     assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_day_availability_excludes_booked_slots(client, db_session) -> None:
+    user = await create_user(db_session)
+    table = await create_table(db_session, name="T-1", seats=2)
+    target_date = date.today() + timedelta(days=2)
+    start_time = to_utc(combine_local(target_date, time(19, 0)))
+    db_session.add(
+        Booking(
+            user_id=user.id,
+            table_id=table.id,
+            start_time=start_time,
+            end_time=start_time + timedelta(hours=2),
+        )
+    )
+    await db_session.commit()
+
+    response = await client.get(
+        "/tables/availability",
+        params={"date": target_date.isoformat()},
+        headers=auth_header(user.id),
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["date"] == target_date.isoformat()
+    available_times = data["tables"][0]["available_times"]
+    assert "12:00:00" in available_times
+    assert "17:00:00" in available_times
+    assert "17:15:00" not in available_times
+    assert "19:00:00" not in available_times
+    assert "20:00:00" not in available_times
+
+
+@pytest.mark.asyncio
+async def test_next_available_skips_booked_slot(client, db_session) -> None:
+    user = await create_user(db_session)
+    table = await create_table(db_session, name="T-1", seats=2)
+    target_date = date.today() + timedelta(days=2)
+    start_time = to_utc(combine_local(target_date, time(19, 0)))
+    db_session.add(
+        Booking(
+            user_id=user.id,
+            table_id=table.id,
+            start_time=start_time,
+            end_time=start_time + timedelta(hours=2),
+        )
+    )
+    await db_session.commit()
+
+    response = await client.get(
+        "/tables/next-available",
+        params={"date": target_date.isoformat(), "time": "19:00", "limit": 2},
+        headers=auth_header(user.id),
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [(slot["date"], slot["time"]) for slot in data] == [
+        (target_date.isoformat(), "17:00:00"),
+        (target_date.isoformat(), "16:45:00"),
+    ]
+    assert all(slot["table_id"] == table.id for slot in data)
+
+
+@pytest.mark.asyncio
+async def test_get_table_supports_if_none_match(client, db_session) -> None:
+    admin = await create_user(db_session, is_admin=True)
+    table = await create_table(db_session, name="T-1", seats=2)
+
+    first = await client.get(f"/tables/{table.id}", headers=auth_header(admin.id))
+    etag = first.headers["ETag"]
+    second = await client.get(
+        f"/tables/{table.id}",
+        headers={**auth_header(admin.id), "If-None-Match": etag},
+    )
+    await create_table(db_session, name="T-2", seats=4)
+    listing = await client.get(
+        "/tables/", headers={**auth_header(admin.id), "If-None-Match": etag}
+    )
+    cached_listing = await client.get(
+        "/tables/",
+        headers={**auth_header(admin.id), "If-None-Match": listing.headers["ETag"]},
+    )
+
+    assert first.status_code == 200
+    assert first.json()["name"] == "T-1"
+    assert second.status_code == 304
+    assert second.headers["ETag"] == etag
+    assert listing.status_code == 200
+    assert len(listing.json()) == 2
+    assert cached_listing.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_retired_table_is_hidden_and_not_bookable(client, db_session) -> None:
+    admin = await create_user(db_session, is_admin=True)
+    table = await create_table(db_session, name="T-1", seats=2)
+    target_date = (date.today() + timedelta(days=2)).isoformat()
+
+    retired = await client.post(
+        f"/tables/{table.id}/retire", headers=auth_header(admin.id)
+    )
+    available = await client.get(
+        "/tables/available",
+        params={"date": target_date, "time": "19:00"},
+        headers=auth_header(admin.id),
+    )
+    booking = await client.post(
+        "/bookings/",
+        json={"table_id": table.id, "date": target_date, "time": "19:00"},
+        headers=auth_header(admin.id),
+    )
+    restored = await client.post(
+        f"/tables/{table.id}/restore", headers=auth_header(admin.id)
+    )
+
+    assert retired.status_code == 200
+    assert retired.json()["retired_at"] is not None
+    assert available.json() == []
+    assert booking.status_code == 404
+    assert restored.json()["retired_at"] is None
+
+
+@pytest.mark.asyncio
+async def test_booking_cannot_be_moved_on_retired_table(client, db_session) -> None:
+    admin = await create_user(db_session, is_admin=True)
+    table = await create_table(db_session, name="T-1", seats=2)
+    target_date = (date.today() + timedelta(days=2)).isoformat()
+    booking = await client.post(
+        "/bookings/",
+        json={"table_id": table.id, "date": target_date, "time": "19:00"},
+        headers=auth_header(admin.id),
+    )
+    rescheduled = await client.patch(
+        f"/bookings/{booking.json()['id']}",
+        json={"date": target_date, "time": "18:00"},
+        headers=auth_header(admin.id),
+    )
+
+    await client.post(f"/tables/{table.id}/retire", headers=auth_header(admin.id))
+    moved = await client.patch(
+        f"/bookings/{booking.json()['id']}",
+        json={"date": target_date, "time": "17:00"},
+        headers=auth_header(admin.id),
+    )
+
+    assert booking.status_code == 201
+    assert rescheduled.status_code == 200
+    assert rescheduled.json()["start_time"] != booking.json()["start_time"]
+    assert moved.status_code == 404
+    assert moved.json()["detail"] == "Table not found"
+
+
+@pytest.mark.asyncio
+async def test_delete_table_removes_it(client, db_session) -> None:
+    admin = await create_user(db_session, is_admin=True)
+    table = await create_table(db_session, name="T-1", seats=2)
+
+    deleted = await client.delete(f"/tables/{table.id}", headers=auth_header(admin.id))
+    missing = await client.delete(f"/tables/{table.id}", headers=auth_header(admin.id))
+
+    assert deleted.status_code == 204
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_admin_can_create_tables_in_bulk(client, db_session) -> None:
+    admin = await create_user(db_session, is_admin=True)
+
+    json_response = await client.post(
+        "/tables/bulk",
+        json={"items": [{"name": "T2-1", "seats": 2}, {"name": "T4-1", "seats": 4}]},
+        headers=auth_header(admin.id),
+    )
+    csv_response = await client.post(
+        "/tables/bulk",
+        content="name,seats\nT6-1,6\nT6-2,6\n",
+        headers={**auth_header(admin.id), "Content-Type": "text/csv"},
+    )
+    invalid_response = await client.post(
+        "/tables/bulk",
+        content="name,seats\nT0-1,0\n",
+        headers={**auth_header(admin.id), "Content-Type": "text/csv"},
+    )
+
+    assert json_response.status_code == 201
+    assert [table["name"] for table in json_response.json()] == ["T2-1", "T4-1"]
+    assert csv_response.status_code == 201
+    assert [table["seats"] for table in csv_response.json()] == [6, 6]
+    assert invalid_response.status_code == 422
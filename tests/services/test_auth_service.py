@@ -2,8 +2,9 @@ from typing import Any, cast
 
 import pytest
 
+from src.auth.schemas import UserCreate, UserLogin
 from src.auth.services import AuthService
-from src.core.errors import BusinessError
+from src.core.errors import BusinessError, TooManyRequestsError, UnauthorizedError
 
 
 class FakeUserRepository:
@@ -15,6 +16,9 @@ class FakeUserRepository:
             return object()
         return None
 
+    async def email_exists(self, email: str) -> bool:
+        return self._exists
+
 
 @pytest.mark.asyncio
 async def test_validate_email_raises_for_existing_user() -> None:
@@ -27,3 +31,67 @@ async def test_validate_email_raises_for_existing_user() -> None:
 async def test_validate_email_allows_new_user() -> None:
     service = AuthService(cast(Any, FakeUserRepository(exists=False)))
     await service.validate_email("user@example.com")
+
+
+class FakeThrottle:
+    def __init__(self, blocked: bool = False) -> None:
+        self.blocked = blocked
+        self.failures: list[tuple[str, str]] = []
+
+    async def check(self, action: str, client_ip: str, email: str) -> None:
+        if self.blocked:
+            raise TooManyRequestsError("Too many attempts", retry_after=4)
+
+    async def record_failure(self, client_ip: str, email: str) -> None:
+        self.failures.append((client_ip, email))
+
+    async def reset(self, email: str) -> None:
+        pass
+
+
+class UntouchableUserRepository:
+    async def get_by_email(self, email: str):
+        raise AssertionError("throttled requests must not reach the database")
+
+
+@pytest.mark.asyncio
+async def test_throttled_login_is_rejected_before_lookup() -> None:
+    service = AuthService(
+        cast(Any, UntouchableUserRepository()), cast(Any, FakeThrottle(blocked=True))
+    )
+    with pytest.raises(TooManyRequestsError):
+        await service.login(
+            UserLogin(email="user@example.com", password="password"), "10.0.0.1"
+        )
+
+
+@pytest.mark.asyncio
+async def test_failed_login_records_failure() -> None:
+    throttle = FakeThrottle()
+    service = AuthService(
+        cast(Any, FakeUserRepository(exists=False)), cast(Any, throttle)
+    )
+    with pytest.raises(UnauthorizedError):
+        await service.login(
+            UserLogin(email="user@example.com", password="password"), "10.0.0.1"
+        )
+    assert throttle.failures == [("10.0.0.1", "user@example.com")]
+
+
+class RacingUserRepository(FakeUserRepository):
+    async def create(self, **kwargs) -> int | None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_register_maps_lost_insert_race_to_business_error() -> None:
+    service = AuthService(cast(Any, RacingUserRepository(exists=False)))
+    with pytest.raises(BusinessError):
+        await service.register(
+            UserCreate(
+                email="user@example.com",
+                password="password",
+                full_name="User",
+                phone_number="100200300",
+            )
+        )
@@ -0,0 +1,74 @@
+from datetime import datetime, time, timedelta, timezone
+from typing import Any, cast
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from src.core.slots import SlotCalendar
+from src.tables.cache import AvailabilityCache, cache_requests
+
+
+class FakeRedis:
+    def __init__(self, values: dict[str, dict[str, str]] | None = None) -> None:
+        self.values = values or {}
+        self.deleted: list[str] = []
+
+    async def hget(self, key: str, field: str):
+        return self.values.get(key, {}).get(field)
+
+    async def delete(self, *keys: str) -> None:
+        self.deleted.extend(keys)
+
+
+def build_calendar(timezone_name: str, slot_minutes: int) -> SlotCalendar:
+    return SlotCalendar(
+        ZoneInfo(timezone_name),
+        slot_minutes,
+        120,
+        30,
+        dict.fromkeys(range(7), (time(12, 0), time(23, 0))),
+    )
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_every_overlapping_slot() -> None:
+    redis = FakeRedis()
+    cache = AvailabilityCache(cast(Any, redis), build_calendar("UTC", 15))
+    start_time = datetime(2026, 2, 7, 19, 0, tzinfo=timezone.utc)
+
+    await cache.invalidate(start_time, start_time + timedelta(hours=2))
+
+    assert redis.deleted[0] == "availability:2026-02-07T17:15:00+00:00"
+    assert redis.deleted[-1] == "availability:2026-02-07T20:45:00+00:00"
+    assert len(redis.deleted) == 15
+
+
+@pytest.mark.asyncio
+async def test_invalidate_uses_local_slot_starts() -> None:
+    # Slots start on the local hour, which is half past in UTC.
+    redis = FakeRedis()
+    cache = AvailabilityCache(cast(Any, redis), build_calendar("Asia/Kolkata", 60))
+    start_time = datetime(2026, 2, 7, 13, 30, tzinfo=timezone.utc)
+
+    await cache.invalidate(start_time, start_time + timedelta(hours=2))
+
+    assert redis.deleted == [
+        "availability:2026-02-07T12:30:00+00:00",
+        "availability:2026-02-07T13:30:00+00:00",
+        "availability:2026-02-07T14:30:00+00:00",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_counts_hits_and_misses() -> None:
+    start_time = datetime(2026, 2, 7, 19, 0, tzinfo=timezone.utc)
+    redis = FakeRedis({"availability:2026-02-07T19:00:00+00:00": {"2": "[]"}})
+    cache = AvailabilityCache(cast(Any, redis))
+    hits = cache_requests.labels(result="hit")._value.get()
+    misses = cache_requests.labels(result="miss")._value.get()
+
+    assert await cache.get(start_time, 2) == []
+    assert await cache.get(start_time, None) is None
+
+    assert cache_requests.labels(result="hit")._value.get() == hits + 1
+    assert cache_requests.labels(result="miss")._value.get() == misses + 1
@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta, timezone
+
+from src.bookings.index import BookingIndex
+
+START = datetime(2026, 2, 7, 12, 0, tzinfo=timezone.utc)
+
+
+def build_index() -> BookingIndex:
+    index = BookingIndex()
+    index.load(
+        [
+            (1, 1, START, START + timedelta(hours=2)),
+            (2, 1, START + timedelta(hours=4), START + timedelta(hours=6)),
+            (3, 2, START + timedelta(hours=1), START + timedelta(hours=3)),
+        ]
+    )
+    return index
+
+
+def test_load_marks_index_ready() -> None:
+    assert not BookingIndex().ready
+    assert build_index().ready
+
+
+def test_has_conflict_detects_overlap() -> None:
+    index = build_index()
+    assert index.has_conflict(1, START + timedelta(hours=1), START + timedelta(hours=3))
+    assert index.has_conflict(1, START + timedelta(hours=5), START + timedelta(hours=7))
+
+
+def test_has_conflict_allows_adjacent_slots() -> None:
+    index = build_index()
+    assert not index.has_conflict(
+        1, START + timedelta(hours=2), START + timedelta(hours=4)
+    )
+    assert not index.has_conflict(3, START, START + timedelta(hours=2))
+
+
+def test_has_conflict_excludes_booking() -> None:
+    index = build_index()
+    assert not index.has_conflict(1, START, START + timedelta(hours=2), 1)
+
+
+def test_upsert_and_remove_update_intervals() -> None:
+    index = build_index()
+    index.upsert(1, 1, START + timedelta(hours=2), START + timedelta(hours=4))
+    assert not index.has_conflict(1, START, START + timedelta(hours=2))
+    index.remove(2)
+    assert not index.has_conflict(
+        1, START + timedelta(hours=4), START + timedelta(hours=6)
+    )
+
+
+def test_busy_tables() -> None:
+    index = build_index()
+    busy = index.busy_tables(START + timedelta(hours=2), START + timedelta(hours=4))
+    assert busy == {2}
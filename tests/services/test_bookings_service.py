@@ -1,20 +1,29 @@
 import asyncio
-from datetime import datetime, time, timedelta, timezone
+from datetime import date, datetime, time, timedelta, timezone
+from types import SimpleNamespace
 from typing import Any, cast
 
 import pytest
+from sqlalchemy.exc import IntegrityError
 
+from src.bookings.repositories import BookingRepository
 from src.bookings.services import BookingService
-from src.core.config import settings
-from src.core.errors import BusinessError
+from src.core.errors import BusinessError, ForbiddenError, NotFoundError
+from src.db.errors import EXCLUSION_VIOLATION, UNIQUE_VIOLATION
 
 
 class FakeBookingRepository:
-    def __init__(self, conflict: bool) -> None:
-        self._conflict = conflict
+    def __init__(self, booking: object | None) -> None:
+        self._booking = booking
 
-    async def has_conflict(self, *args, **kwargs) -> bool:
-        return self._conflict
+    async def update_time(self, *args, **kwargs):
+        return None
+
+    async def cancel(self, *args, **kwargs):
+        return None
+
+    async def get_by_id(self, booking_id: int):
+        return self._booking
 
 
 class FakeTableRepository:
@@ -22,10 +31,11 @@ class FakeTableRepository:
         return None
 
 
-def test_normalize_time_removes_tzinfo() -> None:
-    aware = time(12, 0, tzinfo=timezone.utc)
-    normalized = BookingService._normalize_time(aware)
-    assert normalized.tzinfo is None
+def build_service(booking: object | None) -> BookingService:
+    return BookingService(
+        cast(Any, FakeBookingRepository(booking)),
+        cast(Any, FakeTableRepository()),
+    )
 
 
 def test_cancel_too_close_raises() -> None:
@@ -34,32 +44,96 @@ def test_cancel_too_close_raises() -> None:
         BookingService._ensure_cancel_allowed(start_time)
 
 
-def test_slot_conflict_raises() -> None:
-    service = BookingService(
-        cast(Any, FakeBookingRepository(conflict=True)),
-        cast(Any, FakeTableRepository()),
-    )
+def test_update_missing_booking_raises_not_found() -> None:
+    service = build_service(booking=None)
+    target_date = date.today() + timedelta(days=2)
+    with pytest.raises(NotFoundError):
+        asyncio.run(service.update_booking_time(1, 1, target_date, time(19, 0)))
+
+
+def test_update_foreign_booking_raises_forbidden() -> None:
+    service = build_service(booking=SimpleNamespace(user_id=2))
+    target_date = date.today() + timedelta(days=2)
+    with pytest.raises(ForbiddenError):
+        asyncio.run(service.update_booking_time(1, 1, target_date, time(19, 0)))
+
+
+def test_cancel_too_close_to_start_raises() -> None:
+    start_time = datetime.now(timezone.utc) + timedelta(minutes=30)
+    service = build_service(booking=SimpleNamespace(user_id=1, start_time=start_time))
+    with pytest.raises(BusinessError):
+        asyncio.run(service.cancel_booking(1, 1))
+
+
+class FakeOrig(Exception):
+    def __init__(self, sqlstate: str) -> None:
+        super().__init__(sqlstate)
+        self.sqlstate = sqlstate
+
+
+class FakeSession:
+    def __init__(self, sqlstate: str) -> None:
+        self._sqlstate = sqlstate
+        self.rolled_back = False
+
+    async def execute(self, *args, **kwargs):
+        raise IntegrityError("INSERT", {}, FakeOrig(self._sqlstate))
+
+    async def rollback(self) -> None:
+        self.rolled_back = True
+
+
+def test_create_maps_exclusion_violation_to_business_error() -> None:
+    session = FakeSession(EXCLUSION_VIOLATION)
+    repository = BookingRepository(cast(Any, session))
     start_time = datetime(2026, 2, 7, 12, 0, tzinfo=timezone.utc)
     end_time = datetime(2026, 2, 7, 14, 0, tzinfo=timezone.utc)
     with pytest.raises(BusinessError):
-        asyncio.run(service._ensure_slot_available(1, start_time, end_time))
+        asyncio.run(repository.create(1, 1, start_time, end_time, start_time))
+    assert session.rolled_back
 
 
-def test_booking_window_rejects_past_time() -> None:
-    past_time = datetime.now(timezone.utc) - timedelta(minutes=1)
-    with pytest.raises(BusinessError):
-        BookingService._ensure_booking_window(past_time)
+def test_create_reraises_other_integrity_errors() -> None:
+    session = FakeSession(UNIQUE_VIOLATION)
+    repository = BookingRepository(cast(Any, session))
+    start_time = datetime(2026, 2, 7, 12, 0, tzinfo=timezone.utc)
+    end_time = datetime(2026, 2, 7, 14, 0, tzinfo=timezone.utc)
+    with pytest.raises(IntegrityError):
+        asyncio.run(repository.create(1, 1, start_time, end_time, start_time))
+
 
+class RecordingAvailabilityCache:
+    def __init__(self) -> None:
+        self.invalidated: list[tuple[datetime, datetime]] = []
 
-def test_booking_window_rejects_far_future() -> None:
-    future_time = datetime.now(timezone.utc) + timedelta(
-        days=settings.booking_max_days_ahead + 1
+    async def invalidate(self, start_time: datetime, end_time: datetime) -> None:
+        self.invalidated.append((start_time, end_time))
+
+
+class MovingBookingRepository(FakeBookingRepository):
+    def __init__(self, previous: tuple[datetime, datetime]) -> None:
+        super().__init__(None)
+        self.previous = previous
+
+    async def update_time(self, booking_id, user_id, start_time, end_time, cutoff):
+        booking = SimpleNamespace(start_time=start_time, end_time=end_time)
+        return booking, *self.previous
+
+
+def test_update_invalidates_old_and_new_slot() -> None:
+    old_start = datetime.now(timezone.utc) + timedelta(days=1)
+    old_end = old_start + timedelta(hours=2)
+    cache = RecordingAvailabilityCache()
+    service = BookingService(
+        cast(Any, MovingBookingRepository((old_start, old_end))),
+        cast(Any, FakeTableRepository()),
+        cast(Any, cache),
     )
-    with pytest.raises(BusinessError):
-        BookingService._ensure_booking_window(future_time)
+    target_date = date.today() + timedelta(days=2)
 
+    booking = asyncio.run(service.update_booking_time(1, 1, target_date, time(19, 0)))
 
-def test_booking_window_rejects_non_slot_minutes() -> None:
-    invalid_time = datetime(2026, 2, 7, 12, 7, tzinfo=timezone.utc)
-    with pytest.raises(BusinessError):
-        BookingService._ensure_booking_window(invalid_time)
+    assert cache.invalidated == [
+        (old_start, old_end),
+        (booking.start_time, booking.end_time),
+    ]
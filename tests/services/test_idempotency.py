@@ -0,0 +1,119 @@
+import asyncio
+from typing import Any, cast
+
+import pytest
+from pydantic import TypeAdapter
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.core.errors import BusinessError
+from src.core.idempotency import IdempotencyStore
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    async def set(self, key: str, value: str, nx: bool = False, ex: int = 0):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    async def get(self, key: str):
+        return self.values.get(key)
+
+    def register_script(self, script: str):
+        # The only script is the compare-and-delete release.
+        async def release(keys: list[str], args: list[str]) -> int:
+            if self.values.get(keys[0]) == args[0]:
+                del self.values[keys[0]]
+                return 1
+            return 0
+
+        return release
+
+
+class BrokenRedis:
+    def register_script(self, script: str):
+        return None
+
+    async def set(self, *args, **kwargs):
+        raise RedisConnectionError("down")
+
+
+class Handler:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return self.calls
+
+
+adapter = TypeAdapter(int)
+
+
+@pytest.mark.asyncio
+async def test_repeated_key_replays_response() -> None:
+    store = IdempotencyStore(cast(Any, FakeRedis()))
+    handler = Handler()
+    first = await store.run("key", "scope", "fp", handler, adapter)
+    second = await store.run("key", "scope", "fp", handler, adapter)
+    assert first == second == 1
+    assert handler.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicate_waits_for_first_request() -> None:
+    store = IdempotencyStore(cast(Any, FakeRedis()))
+    handler = Handler()
+    results = await asyncio.gather(
+        store.run("key", "scope", "fp", handler, adapter),
+        store.run("key", "scope", "fp", handler, adapter),
+    )
+    assert results == [1, 1]
+    assert handler.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_key_reuse_with_different_payload_raises() -> None:
+    store = IdempotencyStore(cast(Any, FakeRedis()))
+    await store.run("key", "scope", "fp", Handler(), adapter)
+    with pytest.raises(BusinessError):
+        await store.run("key", "scope", "other", Handler(), adapter)
+
+
+@pytest.mark.asyncio
+async def test_failed_request_releases_key() -> None:
+    redis = FakeRedis()
+    store = IdempotencyStore(cast(Any, redis))
+
+    async def failing() -> int:
+        raise BusinessError("Table is not available for the selected time")
+
+    with pytest.raises(BusinessError):
+        await store.run("key", "scope", "fp", failing, adapter)
+    assert redis.values == {}
+
+
+@pytest.mark.asyncio
+async def test_expired_request_does_not_release_new_claim() -> None:
+    redis = FakeRedis()
+    store = IdempotencyStore(cast(Any, redis))
+
+    async def slow_failing() -> int:
+        # The lease expired and another request claimed the key meanwhile.
+        redis.values["idempotency:scope:key"] = "other request"
+        raise BusinessError("Table is not available for the selected time")
+
+    with pytest.raises(BusinessError):
+        await store.run("key", "scope", "fp", slow_failing, adapter)
+    assert redis.values == {"idempotency:scope:key": "other request"}
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_fall_back_to_handler() -> None:
+    store = IdempotencyStore(cast(Any, BrokenRedis()))
+    handler = Handler()
+    assert await store.run("key", "scope", "fp", handler, adapter) == 1
@@ -0,0 +1,51 @@
+import json
+import logging
+import queue
+import sys
+
+from src.core.logging import JsonFormatter, LogQueueHandler
+
+
+def make_record(**extra) -> logging.LogRecord:
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.getLogger("app.endpoint").makeRecord(
+            "app.endpoint",
+            logging.ERROR,
+            __file__,
+            1,
+            "Endpoint call failed %s",
+            ("bookings",),
+            exc_info=sys.exc_info(),
+            extra=extra,
+        )
+    return record
+
+
+def test_json_formatter_keeps_extra_fields() -> None:
+    record = make_record(event="endpoint_error", duration_seconds=0.25)
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["level"] == "ERROR"
+    assert entry["logger"] == "app.endpoint"
+    assert entry["message"] == "Endpoint call failed bookings"
+    assert entry["event"] == "endpoint_error"
+    assert entry["duration_seconds"] == 0.25
+    assert "ValueError: boom" in entry["exception"]
+    assert "args" not in entry
+
+
+def test_queue_handler_renders_message_and_traceback_before_queueing() -> None:
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    LogQueueHandler(log_queue).handle(make_record(event="endpoint_error"))
+
+    queued = log_queue.get_nowait()
+    entry = json.loads(JsonFormatter().format(queued))
+
+    assert queued.args is None
+    assert queued.exc_info is None
+    assert entry["message"] == "Endpoint call failed bookings"
+    assert entry["event"] == "endpoint_error"
+    assert "ValueError: boom" in entry["exception"]
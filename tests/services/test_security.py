@@ -0,0 +1,51 @@
+import pytest
+
+from src.core.config import settings
+from src.core.security import (
+    calibrate_password_rounds,
+    hash_password,
+    hash_password_async,
+    password_needs_rehash,
+    password_queue_seconds,
+    pwd_context,
+    verify_password_async,
+)
+
+
+def observed_counts() -> dict[str, float]:
+    return {
+        sample.labels["operation"]: sample.value
+        for sample in password_queue_seconds.collect()[0].samples
+        if sample.name.endswith("_count")
+    }
+
+
+@pytest.mark.asyncio
+async def test_password_work_runs_in_pool_and_records_queue_wait() -> None:
+    counts = observed_counts()
+
+    hashed = await hash_password_async("password")
+
+    assert await verify_password_async("password", hashed)
+    assert not await verify_password_async("wrong-password", hashed)
+    new_counts = observed_counts()
+    assert new_counts["hash"] == counts.get("hash", 0) + 1
+    assert new_counts["verify"] == counts.get("verify", 0) + 2
+
+
+def hash_with(scheme: str, rounds: int) -> str:
+    return pwd_context.handler(scheme).using(rounds=rounds).hash("password")
+
+
+def test_only_cheaper_or_deprecated_hashes_need_rehash() -> None:
+    rounds = settings.password_bcrypt_rounds
+
+    assert not password_needs_rehash(hash_password("password"))
+    assert password_needs_rehash(hash_with("bcrypt_sha256", rounds - 1))
+    assert not password_needs_rehash(hash_with("bcrypt_sha256", rounds + 1))
+    assert password_needs_rehash(hash_with("bcrypt", rounds))
+
+
+def test_calibration_stays_within_bounds() -> None:
+    assert calibrate_password_rounds(0, min_rounds=4, max_rounds=6) == 4
+    assert calibrate_password_rounds(10**6, min_rounds=4, max_rounds=6) == 6
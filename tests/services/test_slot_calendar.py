@@ -0,0 +1,96 @@
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from src.core.errors import BusinessError
+from src.core.slots import SlotCalendar
+
+DAILY_HOURS = dict.fromkeys(range(7), (time(12, 0), time(22, 0)))
+
+
+def build_calendar(**overrides) -> SlotCalendar:
+    options = {
+        "timezone": ZoneInfo("UTC"),
+        "slot_minutes": 15,
+        "duration_minutes": 120,
+        "max_days_ahead": 30,
+        "weekly_hours": DAILY_HOURS,
+    }
+    options.update(overrides)
+    return SlotCalendar(**options)
+
+
+def upcoming(days: int = 2) -> date:
+    return datetime.now(timezone.utc).date() + timedelta(days=days)
+
+
+def test_build_slot_returns_utc_bounds() -> None:
+    target_date = upcoming()
+    start_time, end_time = build_calendar().build_slot(
+        target_date, time(12, 0, tzinfo=timezone.utc)
+    )
+    assert start_time == datetime.combine(target_date, time(12, 0), timezone.utc)
+    assert end_time - start_time == timedelta(hours=2)
+
+
+@pytest.mark.parametrize("target_time", [time(11, 0), time(21, 0)])
+def test_outside_working_hours_raises(target_time: time) -> None:
+    with pytest.raises(BusinessError, match="working hours"):
+        build_calendar().build_slot(upcoming(), target_time)
+
+
+def test_non_slot_minutes_raises() -> None:
+    with pytest.raises(BusinessError, match="slot minutes"):
+        build_calendar().build_slot(upcoming(), time(12, 7))
+
+
+def test_past_time_raises() -> None:
+    with pytest.raises(BusinessError, match="past"):
+        build_calendar().build_slot(upcoming(-1), time(12, 0))
+
+
+def test_far_future_raises() -> None:
+    with pytest.raises(BusinessError, match="too far"):
+        build_calendar().build_slot(upcoming(31), time(12, 0))
+
+
+def test_weekday_hours_and_closed_dates() -> None:
+    target_date = upcoming()
+    closed_date = upcoming(3)
+    weekly_hours = {**DAILY_HOURS, target_date.weekday(): (time(18, 0), time(20, 0))}
+    calendar = build_calendar(
+        weekly_hours=weekly_hours, closed_dates=frozenset({closed_date})
+    )
+
+    assert [slot.time() for slot in calendar.day_slots(target_date)] == [time(18, 0)]
+    assert calendar.day_slots(closed_date) == []
+    with pytest.raises(BusinessError, match="not available"):
+        calendar.build_slot(closed_date, time(12, 0))
+
+
+def test_dst_gap_is_skipped_and_duration_is_elapsed_time() -> None:
+    calendar = build_calendar(
+        timezone=ZoneInfo("Europe/Berlin"),
+        slot_minutes=60,
+        weekly_hours=dict.fromkeys(range(7), (time(0, 0), time(6, 0))),
+    )
+    # Clocks jump from 02:00 to 03:00 on 2026-03-29 in Berlin.
+    slots = calendar.day_slots(date(2026, 3, 29))
+
+    assert [slot.time() for slot in slots] == [
+        time(0, 0),
+        time(1, 0),
+        time(3, 0),
+        time(4, 0),
+    ]
+
+
+def test_time_skipped_by_dst_raises() -> None:
+    calendar = build_calendar(
+        timezone=ZoneInfo("Europe/Berlin"),
+        weekly_hours=dict.fromkeys(range(7), (time(0, 0), time(6, 0))),
+    )
+
+    with pytest.raises(BusinessError, match="does not exist"):
+        calendar.build_slot(date(2026, 3, 29), time(2, 30))
@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+
+from src.tables.catalogue import VERSION_KEY, TableCatalogue
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, int] = {}
+
+    async def get(self, key: str):
+        value = self.values.get(key)
+        return None if value is None else str(value)
+
+    async def incr(self, key: str) -> int:
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+
+class FakeTableRepository:
+    def __init__(self) -> None:
+        self.tables = [SimpleNamespace(id=1, name="T-1", seats=2)]
+        self.loads = 0
+
+    async def get_all(self):
+        self.loads += 1
+        return list(self.tables)
+
+
+@pytest.mark.asyncio
+async def test_catalogue_reloads_only_after_version_bump() -> None:
+    redis = FakeRedis()
+    repo = FakeTableRepository()
+    catalogue = TableCatalogue(cast(Any, redis))
+    other_worker = TableCatalogue(cast(Any, redis))
+
+    assert [table.name for table in await catalogue.get_all(cast(Any, repo))] == ["T-1"]
+    assert (await catalogue.get(cast(Any, repo), 1)).seats == 2
+    assert repo.loads == 1
+
+    repo.tables[0] = SimpleNamespace(id=1, name="T-1", seats=4)
+    await other_worker.bump()
+
+    assert redis.values[VERSION_KEY] == 1
+    assert (await catalogue.get(cast(Any, repo), 1)).seats == 4
+    assert await catalogue.get(cast(Any, repo), 2) is None
+    assert repo.loads == 2
+
+
+@pytest.mark.asyncio
+async def test_version_is_trusted_for_the_recheck_period(monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr("src.tables.catalogue.time.monotonic", lambda: now[0])
+    redis = FakeRedis()
+    repo = FakeTableRepository()
+    catalogue = TableCatalogue(cast(Any, redis), recheck_seconds=1)
+    other_worker = TableCatalogue(cast(Any, redis))
+
+    await catalogue.get_all(cast(Any, repo))
+    repo.tables[0] = SimpleNamespace(id=1, name="T-1", seats=4)
+    await other_worker.bump()
+
+    assert (await catalogue.get(cast(Any, repo), 1)).seats == 2
+    now[0] += 1
+    assert (await catalogue.get(cast(Any, repo), 1)).seats == 4
+
+    repo.tables[0] = SimpleNamespace(id=1, name="T-1", seats=6)
+    await catalogue.bump()
+    assert (await catalogue.get(cast(Any, repo), 1)).seats == 6
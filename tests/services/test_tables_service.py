@@ -1,26 +1,17 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
-import pytest
-
-from src.core.errors import BusinessError
 from src.tables.services import TableService
 
-
-def test_within_working_hours() -> None:
-    start_time = datetime(2026, 2, 7, 12, 0, tzinfo=timezone.utc)
-    end_time = datetime(2026, 2, 7, 14, 0, tzinfo=timezone.utc)
-    TableService._ensure_within_working_hours(start_time, end_time)
-
-
-def test_outside_working_hours_raises() -> None:
-    start_time = datetime(2026, 2, 7, 11, 0, tzinfo=timezone.utc)
-    end_time = datetime(2026, 2, 7, 13, 0, tzinfo=timezone.utc)
-    with pytest.raises(BusinessError):
-        TableService._ensure_within_working_hours(start_time, end_time)
+BASE = datetime(2030, 1, 1, 12, tzinfo=timezone.utc)
+HOURS = timedelta(hours=1)
+BUSY = [(BASE, BASE + 2 * HOURS), (BASE + 4 * HOURS, BASE + 6 * HOURS)]
 
 
-def test_different_day_raises() -> None:
-    start_time = datetime(2026, 2, 7, 21, 0, tzinfo=timezone.utc)
-    end_time = datetime(2026, 2, 8, 1, 0, tzinfo=timezone.utc)
-    with pytest.raises(BusinessError):
-        TableService._ensure_same_day(start_time, end_time)
+def test_is_free_checks_overlap_with_sorted_bookings() -> None:
+    assert TableService._is_free(BUSY, BASE - 2 * HOURS, 2 * HOURS)
+    assert TableService._is_free(BUSY, BASE + 2 * HOURS, 2 * HOURS)
+    assert TableService._is_free(BUSY, BASE + 6 * HOURS, 2 * HOURS)
+    assert TableService._is_free([], BASE, 2 * HOURS)
+    assert not TableService._is_free(BUSY, BASE - HOURS, 2 * HOURS)
+    assert not TableService._is_free(BUSY, BASE + 3 * HOURS, 2 * HOURS)
+    assert not TableService._is_free(BUSY, BASE + 5 * HOURS, 2 * HOURS)
@@ -0,0 +1,76 @@
+import time
+from typing import Any, cast
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.auth.schemas import TokenPayload
+from src.auth.tokens import TokenStore
+from src.core.errors import ServiceUnavailableError
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, Any] = {}
+
+    async def get(self, key: str):
+        return self.values.get(key)
+
+    async def mget(self, *keys: str):
+        return [self.values.get(key) for key in keys]
+
+    async def set(self, key: str, value: Any, ex: int, nx: bool) -> bool:
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        return True
+
+    async def incr(self, key: str) -> int:
+        self.values[key] = int(self.values.get(key, 0)) + 1
+        return self.values[key]
+
+
+class UnavailableRedis:
+    async def _fail(self, *args: Any, **kwargs: Any) -> Any:
+        raise RedisConnectionError("connection refused")
+
+    get = mget = set = incr = _fail
+
+
+def build_payload(jti: str, version: int) -> TokenPayload:
+    return TokenPayload(sub=1, exp=int(time.time()) + 60, jti=jti, ver=version)
+
+
+@pytest.mark.asyncio
+async def test_revoked_token_is_rejected_once() -> None:
+    store = TokenStore(cast(Any, FakeRedis()))
+    payload = build_payload("a", 0)
+
+    assert await store.is_active(payload)
+    assert await store.revoke(payload)
+    assert not await store.revoke(payload)
+    assert not await store.is_active(payload)
+    assert await store.is_active(build_payload("b", 0))
+
+
+@pytest.mark.asyncio
+async def test_revoke_all_invalidates_older_versions() -> None:
+    store = TokenStore(cast(Any, FakeRedis()))
+
+    await store.revoke_all(1)
+
+    assert await store.current_version(1) == 1
+    assert not await store.is_active(build_payload("a", 0))
+    assert await store.is_active(build_payload("b", 1))
+
+
+@pytest.mark.asyncio
+async def test_revocation_fails_closed_without_redis() -> None:
+    store = TokenStore(cast(Any, UnavailableRedis()))
+    payload = build_payload("a", 0)
+
+    assert await store.is_active(payload)
+    with pytest.raises(ServiceUnavailableError):
+        await store.revoke(payload)
+    with pytest.raises(ServiceUnavailableError):
+        await store.revoke_all(1)
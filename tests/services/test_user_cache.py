@@ -0,0 +1,54 @@
+from typing import Any, cast
+
+import pytest
+
+from src.auth.cache import UserIdentityCache
+from src.auth.schemas import CurrentUser
+from src.core.config import settings
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    async def get(self, key: str):
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, ex: int) -> None:
+        self.values[key] = value
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+
+@pytest.mark.asyncio
+async def test_local_tier_is_bounded_lru(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "auth_user_cache_size", 2)
+    monkeypatch.setattr(settings, "auth_user_cache_redis_enabled", False)
+    cache = UserIdentityCache(cast(Any, FakeRedis()))
+
+    await cache.set("a", CurrentUser(id=1, is_admin=False))
+    await cache.set("b", CurrentUser(id=2, is_admin=False))
+    assert await cache.get(1, "a") is not None
+    await cache.set("c", CurrentUser(id=3, is_admin=False))
+
+    assert await cache.get(2, "b") is None
+    assert await cache.get(1, "a") is not None
+    assert await cache.get(2, "a") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_is_shared_and_invalidated(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "auth_user_cache_redis_enabled", True)
+    redis = FakeRedis()
+    worker = UserIdentityCache(cast(Any, redis))
+    other_worker = UserIdentityCache(cast(Any, redis))
+
+    await worker.set("token", CurrentUser(id=1, is_admin=True))
+    assert await other_worker.get(1, "other-token") == CurrentUser(id=1, is_admin=True)
+
+    await worker.invalidate(1)
+
+    assert await worker.get(1, "token") is None
+    assert redis.values == {}